@@ -0,0 +1,195 @@
+"""
+Copyright 2018 Akamai Technologies, Inc. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+"activate --manifest" and "deploy": activating many configs in order, and
+new-config, patch, and activate chained into one command.
+"""
+
+import os
+import time
+from collections import Counter
+
+import papi
+import patch
+from journal import Journal
+from sessions import transport_errors
+
+# Activation statuses that will not change any further
+ACTIVATION_DONE = ('ACTIVE', 'INACTIVE', 'FAILED', 'ABORTED', 'DEACTIVATED')
+
+# Status lookups of one activation that may fail in a row before it is given up as FAILED
+STATUS_MISSES = 5
+
+
+def papi_activate_manifest(account_key, manifest, network, email, workers, poll, resume,
+                           state_dir, verbose):
+    """ activate many configs together and follow them in one polling loop """
+    import csv
+    from concurrent.futures import ThreadPoolExecutor
+
+    if not network or not email:
+        print('Akamai Network, and email address\
+            are required to activate a config.')
+        raise SystemExit
+
+    # Parse the CSV manifest into groups of activations keyed by their (optional) order column.
+    # Every activation of an order must be ACTIVE before the next order is submitted, which
+    # lets origin properties go out ahead of the edge properties that depend on them.
+    waves = {}
+    invalid = []
+    with open(manifest) as csv_file:
+        csv_reader = csv.reader(csv_file, delimiter=',')
+        line_count = 0
+        for row in csv_reader:
+            if len(row) >= 1: # the len(row) is the number of columns, not the total character count
+                if line_count == 0:
+                    print("Processing CSV manifest")
+                    line_count += 1
+                else:
+                    line_count += 1
+                    if len(row) < 4:
+                        invalid.append((line_count, 'needs contract, group, property and version'))
+                        continue
+                    vid = row[3].strip()
+                    order = row[4].strip() if len(row) >= 5 else ''
+                    if not vid.isdigit():
+                        invalid.append((line_count, 'version "' + vid + '" is not a number'))
+                        continue
+                    if order and not order.lstrip('-').isdigit():
+                        invalid.append((line_count, 'order "' + order + '" is not a whole number'))
+                        continue
+                    waves.setdefault(int(order or 0), []).append({"cid": row[0].strip(),
+                                                                  "gid": row[1].strip(),
+                                                                  "pid": row[2].strip(),
+                                                                  "vid": vid,
+                                                                  "link": None,
+                                                                  "status": "NOT_SUBMITTED",
+                                                                  "misses": 0})
+        print("\tProcessed " + str(line_count - 1) + " rows", '\n')
+
+    if invalid:
+        print('These rows of ' + manifest + ' cannot be activated:')
+        for line, reason in invalid:
+            print('\t', 'line ' + str(line) + ':', reason)
+        print('\n')
+        raise SystemExit
+
+    # Activations that went ACTIVE in an earlier run are not sent again with --resume
+    job = 'activate_' + os.path.basename(manifest) + '_' + network
+    no_response = (SystemExit,) + transport_errors()
+    with Journal(state_dir, job, resume) as journal:
+
+        def submit(item):
+            try:
+                item["link"] = papi.papi_activation(account_key, item["cid"], item["gid"],
+                                                    item["pid"], item["vid"], network, email,
+                                                    verbose)
+                item["status"] = "SUBMITTED"
+            except no_response:
+                print("\tCould not submit " + item["pid"] + " version " + item["vid"], '\n')
+
+        def check(item):
+            try:
+                item["status"] = papi.papi_activation_status(item["link"], verbose)
+                item["misses"] = 0
+            except no_response:
+                # Keep the last known status and try again on the next poll, unless the lookup
+                # keeps failing (a 403 or a stale link never recovers) and the order would wait
+                # on it forever
+                item["misses"] += 1
+                if item["misses"] >= STATUS_MISSES:
+                    print("\tGave up on the status of " + item["pid"] + " version " +
+                          item["vid"] + " after " + str(STATUS_MISSES) + " failed lookups", '\n')
+                    item["status"] = "FAILED"
+
+        for order in sorted(waves):
+            activations = [item for item in waves[order]
+                           if item["pid"] + '_v' + item["vid"] not in journal]
+            if not activations:
+                continue
+            print("Submitting " + str(len(activations)) + " activation(s) with order " +
+                  str(order))
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(submit, activations))
+
+                # One polling loop follows every activation of this order until they all finish
+                pending = [item for item in activations if item["link"]]
+                while pending:
+                    time.sleep(poll)
+                    list(executor.map(check, pending))
+                    pending = [item for item in pending if item["status"] not in ACTIVATION_DONE]
+                    summary = Counter(item["status"] for item in activations)
+                    print('\t', 'order ' + str(order) + ':',
+                          ', '.join(status + ' ' + str(count) for status, count in
+                                    sorted(summary.items())) + ';',
+                          str(len(activations) - len(pending)) + '/' + str(len(activations)),
+                          'finished;')
+
+            print('\t', 'propertyId;', 'propertyVersion;', 'network;', 'status;')
+            for item in activations:
+                print('\t', item["pid"] + ';', item["vid"] + ';', network + ';',
+                      item["status"] + ';')
+            print('\n')
+
+            for item in activations:
+                if item["status"] == "ACTIVE":
+                    journal.record(item["pid"] + '_v' + item["vid"], item["status"])
+            failed = [item["pid"] + '_v' + item["vid"] for item in activations
+                      if item["status"] != "ACTIVE"]
+            if failed:
+                print('Not every activation with order ' + str(order) + ' went ACTIVE, so the '
+                      'remaining orders were not submitted.', '\n')
+                journal.finish(failed)
+
+        journal.finish([])
+
+
+def papi_deploy(account_key, cid, gid, pid, version_source, file, network, email, resume,
+                state_dir, verbose):
+    """ new-config, patch, and activate a config in one go """
+
+    if not cid or not gid or not pid or not file:
+        print('Contract ID, Group ID, Property ID, and a CSV file are required to deploy a '
+              'config.')
+        raise SystemExit
+    if not network or not email:
+        print('Akamai Network, and email address are required to deploy a config.')
+        raise SystemExit
+
+    # Bad rows of the CSV file are stopped before a new version is made for them to go into
+    patch.hosts_check(account_key, cid, gid, file, state_dir, verbose)
+
+    # Each step hands its version number to the next one instead of it being copied between
+    # three runs, and the status lookups the separate commands print are left out.  The journal
+    # keeps that version number, so --resume carries on with the same new version.
+    with Journal(state_dir, 'deploy_' + pid, resume) as journal:
+        if "new-config" not in journal:
+            vid = papi.papi_newconfig(account_key, cid, gid, pid, version_source, verbose,
+                                      report=False)
+            if not vid:
+                print('No new version of ' + pid + ' came back, so there is nothing to patch.',
+                      '\n')
+                journal.finish(["new-config"])
+            journal.record("new-config", vid)
+        vid = journal.result("new-config")
+        if "patch" not in journal:
+            journal.record("patch", patch.papi_patch(account_key, cid, gid, pid, vid, file, resume,
+                                                    state_dir, verbose))
+        if "activate" not in journal:
+            link = papi.papi_activation(account_key, cid, gid, pid, vid, network, email, verbose)
+            print("Activation Request has been sent!  Follow it with:", link, '\n')
+            journal.record("activate", link)
+        journal.finish([])
@@ -0,0 +1,191 @@
+"""
+Copyright 2018 Akamai Technologies, Inc. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+The "history" and "watch" commands: the version history of every property in
+a local table, and a stream of the versions moving while it runs.
+"""
+
+import json
+import os
+import sys
+import time
+from urllib.parse import urljoin
+
+import papi
+
+# A rule format (vYYYY-MM-DD) frozen longer ago than this counts as old in the history report.
+# The --query help in AkaPAPI.py states it.
+OLD_RULE_FORMAT_YEARS = 2
+
+# Reports the "history" command runs against its local table of versions.  AkaPAPI.py lists
+# their names for --query.
+HISTORY_QUERIES = {
+    'changes-per-user': (
+        ('updatedByUser', 'week', 'versions'),
+        "SELECT updatedByUser, strftime('%Y-W%W', updatedDate), COUNT(*) FROM versions "
+        "GROUP BY 1, 2 ORDER BY 2, 1"),
+    'old-rule-formats': (
+        ('propertyName', 'propertyId', 'latestVersion', 'ruleFormat'),
+        "SELECT propertyName, propertyId, MAX(propertyVersion), ruleFormat FROM versions "
+        "GROUP BY propertyId HAVING ruleFormat != 'latest' AND "
+        "ruleFormat < 'v' || date('now', '-%d years') "
+        "ORDER BY ruleFormat, propertyName" % OLD_RULE_FORMAT_YEARS),
+    'never-activated': (
+        ('propertyName', 'propertyId', 'propertyVersion', 'updatedDate', 'updatedByUser'),
+        "SELECT propertyName, propertyId, propertyVersion, updatedDate, updatedByUser "
+        "FROM versions WHERE productionStatus = 'INACTIVE' AND stagingStatus = 'INACTIVE' "
+        "ORDER BY propertyName, propertyVersion"),
+}
+
+# Property fields the "watch" command reports changes of, and how many seconds it waits after
+# a poll that saw one (the wait doubles up to --poll while nothing changes)
+WATCH_FIELDS = ('latestVersion', 'stagingVersion', 'productionVersion')
+WATCH_FASTEST = 5
+
+
+def papi_history(account_key, cid, gid, query, cached, workers, state_dir, verbose):
+    """ Collecting the version history of every property into a local table and reporting on it """
+    import sqlite3
+    from concurrent.futures import ThreadPoolExecutor
+
+    if (cid and not gid) or (gid and not cid):
+        print('Contract ID and Group ID go together.  Leave both out to collect the history of '
+              'every property in the account.')
+        raise SystemExit
+
+    os.makedirs(state_dir, exist_ok=True)
+    history_db = sqlite3.connect(os.path.join(state_dir, 'history.db'))
+    history_db.execute('CREATE TABLE IF NOT EXISTS versions (propertyId TEXT, propertyName TEXT, '
+                       'propertyVersion INTEGER, updatedDate TEXT, updatedByUser TEXT, '
+                       'productionStatus TEXT, stagingStatus TEXT, ruleFormat TEXT, '
+                       'PRIMARY KEY (propertyId, propertyVersion))')
+
+    if not cached:
+        pairs = papi.property_pairs(account_key, cid, gid, verbose)
+        props = papi.property_lists(account_key, pairs, workers, verbose)
+        print("Collecting the history of " + str(len(props)) + " properties")
+
+        def versions(prop):
+            try:
+                return (prop[2], papi.papi_version_list(account_key, prop[0], prop[1],
+                                                        prop[2]['propertyId'],
+                                                        verbose)["versions"]["items"])
+            except SystemExit:
+                print('\t', 'Skipping the history of ' + prop[2]['propertyId'], '\n')
+                return (prop[2], [])
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            rows = [(prop['propertyId'], prop['propertyName'], items['propertyVersion'],
+                     items['updatedDate'], items['updatedByUser'], items['productionStatus'],
+                     items['stagingStatus'], items['ruleFormat'])
+                    for prop, found in executor.map(versions, props) for items in found]
+
+        with history_db:
+            history_db.executemany('INSERT OR REPLACE INTO versions '
+                                   'VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows)
+        print("\tStored " + str(len(rows)) + " versions", '\n')
+
+    if query in HISTORY_QUERIES:
+        print(query + ':')
+        heading, sql = HISTORY_QUERIES[query]
+        print('\t', ' '.join(column + ';' for column in heading))
+        for row in history_db.execute(sql):
+            print('\t', ' '.join(str(column) + ';' for column in row))
+        print('\n')
+
+    history_db.close()
+
+
+def papi_watch(account_key, cid, gid, poll, verbose):
+    """ Streaming an event whenever a property's latest, staging or production version moves """
+
+    if (cid and not gid) or (gid and not cid):
+        print('Contract ID and Group ID go together.  Leave both out to watch every property in '
+              'the account.')
+        raise SystemExit
+
+    gssapi = ''
+    if account_key:
+        gssapi = '&accountSwitchKey=' + account_key
+    session = papi.papi_session()
+    pairs = papi.property_pairs(account_key, cid, gid, verbose)
+
+    # Everything lives in memory: the ETag and properties of the last answer for each
+    # contract/group pair, so an idle poll is a 304 with nothing to compare
+    stored = {}
+    print('Watching the properties of ' + str(len(pairs)) + ' contract/group pair(s), '
+          'one JSON event per line.  Ctrl-C to stop.', file=sys.stderr)
+
+    def event(pair, prop, field, before, after):
+        print(json.dumps({'time': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+                          'contractId': pair[0], 'groupId': pair[1],
+                          'propertyId': prop['propertyId'],
+                          'propertyName': prop['propertyName'],
+                          'field': field, 'from': before, 'to': after}), flush=True)
+
+    wait = WATCH_FASTEST
+    try:
+        while True:
+            changed = False
+            for pair in pairs:
+                url = urljoin(papi.BASEURL, '/papi/v1/properties?contractId=' + pair[0] +
+                              '&groupId=' + pair[1] + gssapi)
+                etag = stored[pair][0] if pair in stored else None
+                headers = {'If-None-Match': etag} if etag else {}
+                try:
+                    result = session.get(url, headers=headers)
+                except Exception as error: # pylint: disable=broad-except
+                    # A network blip should not end a watch, the next poll tries again
+                    print('\t', pair[0], pair[1], str(error), file=sys.stderr)
+                    continue
+                if result.status_code == 304:
+                    continue
+                if result.status_code != 200:
+                    print('\t', pair[0], pair[1], 'status', result.status_code, file=sys.stderr)
+                    continue
+
+                list_dict = result.json()
+                papi.verbose_check(verbose, list_dict, 'papi_watch',
+                                   [account_key, pair[0], pair[1]])
+                current = {items['propertyId']: items
+                           for items in list_dict["properties"]["items"]}
+                if pair in stored:
+                    for prop, field, before, after in property_changes(stored[pair][1], current):
+                        event(pair, prop, field, before, after)
+                        changed = True
+                # Without an ETag there is nothing to send back, so every poll gets the full list
+                stored[pair] = (result.headers.get('ETag'), current)
+
+            # Activations tend to come in bursts, so look again soon after a change and back
+            # off towards --poll while nothing moves
+            wait = WATCH_FASTEST if changed else min(wait * 2, poll)
+            time.sleep(wait)
+    except KeyboardInterrupt:
+        print('Stopped watching.', file=sys.stderr)
+
+
+def property_changes(before, current):
+    """ (property, field, old value, new value) for each WATCH_FIELDS value that differs, a
+    property that appeared or went away has None on its missing side """
+    changes = []
+    for pid in sorted(set(before) | set(current)):
+        prop = current.get(pid, before.get(pid))
+        for field in WATCH_FIELDS:
+            old = before[pid][field] if pid in before else None
+            new = current[pid][field] if pid in current else None
+            if old != new:
+                changes.append((prop, field, old, new))
+    return changes
+
@@ -0,0 +1,107 @@
+"""
+Copyright 2018 Akamai Technologies, Inc. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+The journal batch commands keep so that --resume can skip what already
+completed.
+"""
+
+import json
+import os
+import threading
+
+from sessions import transport_errors
+
+
+class Journal:
+    """ Append-only record of the units of a batch job that completed, so a rerun can skip them """
+
+    def __init__(self, state_dir, job, resume):
+        self.path = os.path.join(state_dir, 'journal_' + job + '.jsonl')
+        self.done = {}
+        self.lock = threading.Lock()
+        complete_line = True
+        if resume and os.path.isfile(self.path):
+            with open(self.path) as journal_file:
+                for line in journal_file:
+                    complete_line = line.endswith('\n')
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # A line cut short by the interruption we are resuming from
+                        continue
+                    self.done[entry["unit"]] = entry["result"]
+            print("Resuming " + job + ": skipping " + str(len(self.done)) +
+                  " completed unit(s) found in " + self.path, '\n')
+        os.makedirs(state_dir, exist_ok=True)
+        self.file = open(self.path, 'a' if resume else 'w')
+        if not complete_line:
+            self.file.write('\n')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __contains__(self, unit):
+        return unit in self.done
+
+    def result(self, unit):
+        """ what the unit returned when it completed """
+        return self.done.get(unit)
+
+    def record(self, unit, result=None):
+        """ writing a completed unit down before anything else happens """
+        with self.lock:
+            self.done[unit] = result
+            self.file.write(json.dumps({"unit": unit, "result": result}) + '\n')
+            self.file.flush()
+            os.fsync(self.file.fileno())
+
+    def run(self, units, workers=1):
+        """ calling function(*args) for every (unit, function, args) not completed yet, with up to
+        workers of them running at the same time """
+        from concurrent.futures import ThreadPoolExecutor
+
+        def call(unit_function_args):
+            unit, function, args = unit_function_args
+            try:
+                self.record(unit, function(*args))
+                return None
+            except SystemExit:
+                # success_check already said why, carry on with the next unit
+                return unit
+            except transport_errors() as error:
+                print('\t', unit + ':', 'no response from PAPI,', str(error), '\n')
+                return unit
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return [unit for unit in executor.map(call, [item for item in units
+                                                         if item[0] not in self.done]) if unit]
+
+    def close(self):
+        """ closing the journal file, everything recorded is already on disk """
+        if not self.file.closed:
+            self.file.close()
+
+    def finish(self, failed):
+        """ closing the journal and stopping if any unit did not complete """
+        self.close()
+        if failed:
+            print(str(len(failed)) + ' unit(s) did not complete:')
+            for unit in failed:
+                print('\t', unit)
+            print('Run the same command again with --resume to redo only these.', '\n')
+            raise SystemExit
@@ -0,0 +1,115 @@
+"""
+Copyright 2018 Akamai Technologies, Inc. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Turning --contract-name, --group-name and --property-name into IDs through a
+local index of the names in the account.
+"""
+
+import json
+import os
+from urllib.parse import urlparse
+
+import papi
+
+
+def resolve_names(account_key, cid, gid, pid, contract_name, group_name, property_name, workers,
+                  state_dir, verbose):
+    """ turning --contract-name, --group-name and --property-name into the IDs commands take """
+
+    index = name_index(account_key, workers, state_dir, verbose)
+    matches = name_matches(index, cid, gid, pid, contract_name, group_name, property_name)
+    if not matches:
+        # A name given since the index was built is not in it yet
+        index = name_index(account_key, workers, state_dir, verbose, refresh=True)
+        matches = name_matches(index, cid, gid, pid, contract_name, group_name, property_name)
+
+    if not matches:
+        print('Nothing in the account matches:')
+        for kind, name in (('contracts', contract_name), ('groups', group_name),
+                           ('properties', property_name)):
+            if name:
+                print('\t', kind + ':', name + papi.did_you_mean(name, index[kind].keys()))
+        print('\n')
+        raise SystemExit
+    if len(matches) > 1:
+        print('More than one contract/group/property matches, narrow it down with --cid, --gid, '
+              'or another name:')
+        print('\t', 'contractId;', 'groupId;', 'propertyId;')
+        for match in matches:
+            print('\t', ' '.join(str(ids) + ';' for ids in match))
+        print('\n')
+        raise SystemExit
+
+    return matches[0]
+
+
+def name_matches(index, cid, gid, pid, contract_name, group_name, property_name):
+    """ Every (contractId, groupId, propertyId) that fits all of the IDs and names given """
+
+    cids = set(index["contracts"].get(contract_name, [])) if contract_name else None
+    if cid:
+        cids = {cid} if cids is None else cids & {cid}
+    gids = set(group[0] for group in index["groups"].get(group_name, [])) if group_name else None
+    if gid:
+        gids = {gid} if gids is None else gids & {gid}
+
+    if property_name:
+        candidates = [tuple(ids) for ids in index["properties"].get(property_name, [])
+                      if not pid or ids[2] == pid]
+    elif group_name:
+        candidates = [(contract, group[0], pid) for group in index["groups"][group_name]
+                      for contract in group[1]] if group_name in index["groups"] else []
+    else:
+        candidates = [(contract, gid, pid) for contract in sorted(cids)]
+
+    return sorted(set(ids for ids in candidates
+                      if (cids is None or ids[0] in cids) and (gids is None or ids[1] in gids)),
+                  key=str)
+
+
+def name_index(account_key, workers, state_dir, verbose, refresh=False):
+    """ contract, group and property names of the account, from the local index when we have one """
+
+    # An API client belongs to one account, unless an accountSwitchKey moves it to another
+    index_file = os.path.join(state_dir, 'names_' + urlparse(papi.BASEURL).hostname.split('.')[0] +
+                              ('_' + account_key if account_key else '') + '.json')
+    if refresh or not os.path.isfile(index_file):
+        name_index_save(account_key, workers, index_file, verbose)
+
+    with open(index_file) as json_file:
+        return json.load(json_file)
+
+
+def name_index_save(account_key, workers, index_file, verbose):
+    """ keeping every contract, group and property ID keyed by its name """
+
+    print("Indexing the contract, group and property names of the account", '\n')
+    index = {"contracts": {}, "groups": {}, "properties": {}}
+    for items in papi.papi_contract_list(account_key, verbose)["contracts"]["items"]:
+        index["contracts"].setdefault(items["contractTypeName"], []).append(items["contractId"])
+    groups = papi.papi_group_list(account_key, verbose)["groups"]["items"]
+    for items in groups:
+        index["groups"].setdefault(items["groupName"], []).append(
+            [items["groupId"], items.get("contractIds", [])])
+
+    pairs = papi.property_pairs(account_key, None, None, verbose, groups)
+    for contract, group, items in papi.property_lists(account_key, pairs, workers, verbose):
+        index["properties"].setdefault(items["propertyName"], []).append(
+            [contract, group, items["propertyId"]])
+
+    os.makedirs(os.path.dirname(index_file), exist_ok=True)
+    with open(index_file + '.tmp', 'w') as json_file:
+        json.dump(index, json_file)
+    os.replace(index_file + '.tmp', index_file)
@@ -0,0 +1,913 @@
+"""
+Copyright 2018 Akamai Technologies, Inc. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+The PAPI calls behind AkaPAPI.py.  Keeping them in a module of their own lets
+python reuse the compiled copy from __pycache__ on every run, and the heavier
+libraries (requests, sqlite3, ...) are only imported by the calls that use them.
+The commands built from several of these calls (patch, render, deploy, history,
+watch, and the name lookups) have modules of their own next to this one.
+"""
+
+import json
+import os
+import sys
+import threading
+from urllib.parse import urljoin
+
+from journal import Journal
+from sessions import H2Session, RecordingSession, ReplaySession
+from signer import EdgeGridSigner
+
+# The .edgerc credentials every call signs with, set by AkaPAPI.py before a command runs
+EDGERC = None
+SECTION = 'default'
+BASEURL = ''
+
+# Built once by papi_session() and shared by every papi_* call, threads included
+PAPI_SESSION = {}
+SESSION_LOCK = threading.Lock()
+TRANSPORT = 'h1'
+
+# Directories the session writes every exchange to, or answers every request from instead of the
+# network (--record and --replay)
+RECORD_DIR = None
+REPLAY_DIR = None
+
+
+def papi_groups(account_key, verbose):
+    """ Getting a list of groups """
+
+    list_dict = papi_group_list(account_key, verbose)
+
+    print('accountId:', list_dict["accountId"])
+    print('accountName:', list_dict["accountName"])
+    print('Groups:')
+    sorted_groups = sorted(list_dict["groups"]["items"], key=lambda x: x['groupName'])
+    print('\t', 'groupName;', 'groupId;', 'parentGroupId;')
+    for items in sorted_groups:
+        parent_id = items["parentGroupId"] if "parentGroupId" in items else "n/a"
+        print('\t', items['groupName'] + ';', items['groupId'] + ';', parent_id + ';')
+    print('\n')
+
+
+def papi_group_list(account_key, verbose):
+    """ Not doing any checks because you should call this directly.  There is no value. """
+
+    gssapi = ''
+    if account_key:
+        gssapi = '?accountSwitchKey=' + account_key
+    session = papi_session()
+    result = session.get(urljoin(BASEURL, '/papi/v1/groups' + gssapi))
+
+    # Get result of dictionaries and put them into a list
+    list_dict = result.json()
+
+    verbose_check(verbose, list_dict, 'papi_group_list', [account_key])
+    success_check(result.status_code, "200", list_dict, verbose)
+
+    return list_dict
+
+
+def papi_contracts(account_key, verbose):
+    """ Getting a list of contracts """
+
+    list_dict = papi_contract_list(account_key, verbose)
+
+    print('accountId:', list_dict["accountId"])
+    print('Contracts:')
+    list_parse(list_dict["contracts"]["items"], verbose)
+    print('\n')
+
+
+def papi_contract_list(account_key, verbose):
+    """ Not doing any checks because you should call this directly.  There is no value. """
+
+    gssapi = ''
+    if account_key:
+        gssapi = '?accountSwitchKey=' + account_key
+    session = papi_session()
+    result = session.get(urljoin(BASEURL, '/papi/v1/contracts' + gssapi))
+
+    # Get result of dictionaries and put them into a list
+    list_dict = result.json()
+
+    verbose_check(verbose, list_dict, 'papi_contract_list', [account_key])
+    success_check(result.status_code, "200", list_dict, verbose)
+
+    return list_dict
+
+
+def papi_products(account_key, cid, verbose):
+    """ Getting a list of products """
+
+    if not cid:
+        print('Contract ID is required to get a list of Products.  '
+              'To get a list of contracts, use "./' +
+              os.path.basename(sys.argv[0]) + ' contracts"', '\n')
+        raise SystemExit
+
+    gssapi = ''
+    if account_key:
+        gssapi = '&accountSwitchKey=' + account_key
+    session = papi_session()
+    result = session.get(urljoin(BASEURL, '/papi/v1/products?contractId=' + cid + gssapi))
+
+    # Get result of dictionaries and put them into a list
+    list_dict = result.json()
+
+    verbose_check(verbose, list_dict, 'papi_products', [account_key, cid])
+    success_check(result.status_code, "200", list_dict, verbose)
+
+    print('accountId:', list_dict["accountId"])
+    print('contractId:', list_dict["contractId"])
+    print('Products:')
+    sorted_groups = sorted(list_dict["products"]["items"], key=lambda x: x['productName'])
+    print('\t', 'productName;', 'productId;')
+    for items in sorted_groups:
+        print('\t', items['productName']+';', items['productId']+';')
+    print('\n')
+
+
+def papi_cpcodes(account_key, cid, gid, verbose):
+    """ Getting a list of all CPCodes within a group """
+
+    if not cid:
+        print('Contract ID is required to get a list of CPCodes.  '
+              'To get a list of contracts, use "./' +
+              os.path.basename(sys.argv[0]) + ' contracts"', '\n')
+        raise SystemExit
+    if not gid:
+        print('Group ID is required to get a list of CPCodes.  '
+              'To get a list of groups, use "./' +
+              os.path.basename(sys.argv[0]) + ' groups"', '\n')
+        raise SystemExit
+
+    gssapi = ''
+    if account_key:
+        gssapi = '&accountSwitchKey=' + account_key
+    session = papi_session()
+    result = session.get(urljoin(BASEURL, '/papi/v1/cpcodes?contractId=' + cid +
+                                 '&groupId=' + gid + gssapi))
+
+    # Get result of dictionaries and put them into a list
+    list_dict = result.json()
+
+    verbose_check(verbose, list_dict, 'papi_cpcodes',
+                  [account_key, cid, gid])
+    success_check(result.status_code, "200", list_dict, verbose)
+
+    print('accountId:', list_dict["accountId"])
+    print('contractId:', list_dict["contractId"])
+    print('groupId:', list_dict["groupId"])
+    print('CPCodes:')
+    sorted_groups = sorted(list_dict["cpcodes"]["items"], key=lambda x: x['cpcodeName'])
+    print('\t', 'cpcodeName;', 'cpcodeId;', 'productIds;', 'createdDate;')
+    for items in sorted_groups:
+        print('\t', items['cpcodeName']+';', items['cpcodeId']+';',
+              str(items['productIds'])+';', items['createdDate']+';')
+    print('\n')
+
+
+def papi_newcpcode(account_key, cid, gid, prd, cpname, file, workers, resume, state_dir,
+                   verbose):
+    """ Requesting a new CPCode """
+
+    if not cid:
+        print('Contract ID is required to make a new CPCode.  '
+              'To get a list of contracts, use "./' +
+              os.path.basename(sys.argv[0]) + ' contracts"', '\n')
+        raise SystemExit
+    if not gid:
+        print('Group ID is required to make a new CPCode.  '
+              'To get a list of groups, use "./' +
+              os.path.basename(sys.argv[0]) + ' groups"', '\n')
+        raise SystemExit
+    if file:
+        papi_newcpcode_file(account_key, cid, gid, prd, file, workers, resume, state_dir,
+                            verbose)
+        return
+
+    if not prd:
+        print('Product ID is required to make a new CPCode.  '
+              'To get a list of products, use "./' +
+              os.path.basename(sys.argv[0]) + ' products"', '\n')
+        raise SystemExit
+    if not cpname:
+        print('A CPCode Name is required to make a new CPCode', '\n')
+        raise SystemExit
+
+    papi_cpcode(account_key, cid, gid, prd, cpname, verbose)
+
+
+def papi_newcpcode_file(account_key, cid, gid, prd, file, workers, resume, state_dir,
+                        verbose):
+    """ Requesting a new CPCode for every row of a CSV file """
+    import csv
+
+    # Parse the CSV file: "cpcode name" and an optional "product id" that overrides --prd
+    cpcodes = []
+    with open(file) as csv_file:
+        csv_reader = csv.reader(csv_file, delimiter=',')
+        line_count = 0
+        for row in csv_reader:
+            if len(row) >= 1: # the len(row) is the number of columns, not the total character count
+                if line_count == 0:
+                    print("Processing CSV file for CPCodes")
+                    line_count += 1
+                else:
+                    product = row[1].strip() if len(row) >= 2 and row[1].strip() else prd
+                    cpcodes.append((row[0].strip(), product))
+                    line_count += 1
+        print("\tProcessed " + str(line_count - 1) + " rows", '\n')
+
+    if not all(product for cpname, product in cpcodes):
+        print('Product ID is required to make a new CPCode.  Use --prd or a second CSV column.  '
+              'To get a list of products, use "./' +
+              os.path.basename(sys.argv[0]) + ' products"', '\n')
+        raise SystemExit
+
+    with Journal(state_dir, 'new-cpcode_' + cid + '_' + gid, resume) as journal:
+        failed = journal.run([(cpname, papi_cpcode,
+                               (account_key, cid, gid, product, cpname, verbose))
+                              for cpname, product in cpcodes], workers)
+        journal.finish(failed)
+
+
+def papi_cpcode(account_key, cid, gid, prd, cpname, verbose):
+    """ Not doing any checks because you should call this directly.  There is no value. """
+
+    data = '{"productId": "' + prd + '","cpcodeName": "' + cpname + '"}'
+    headers = {'Content-Type': 'application/json'}
+
+    gssapi = ''
+    if account_key:
+        gssapi = '&accountSwitchKey=' + account_key
+    session = papi_session()
+    result = session.post(urljoin(BASEURL, '/papi/v1/cpcodes?contractId=' + cid +
+                                  '&groupId=' + gid + gssapi), data=(data), headers=headers)
+
+    # Get result of dictionaries and put them into a list
+    list_dict = result.json()
+
+    verbose_check(verbose, list_dict, 'papi_cpcode',
+                  [account_key, cid, gid, prd, cpname])
+    success_check(result.status_code, "201", list_dict, verbose)
+
+    if list_dict["cpcodeLink"]:
+        string = list_dict["cpcodeLink"]
+        paths = string.split('?')
+        subpaths = paths[0].split('/')
+        print("Your new CPCode is: " + subpaths[4].replace("cpc_", ""))
+        papi_status(string, "papi_newcpcode", verbose)
+        return subpaths[4].replace("cpc_", "")
+
+    return None
+
+
+def papi_properties(account_key, cid, gid, verbose):
+    """ Getting a list of properties """
+
+    if not cid:
+        print('Contract ID is required to get a list of properties.  '
+              'To get a list of contracts, use "./' +
+              os.path.basename(sys.argv[0]) + ' contracts"', '\n')
+        raise SystemExit
+    if not gid:
+        print('Group ID is required to get a list of properties.  '
+              'To get a list of groups, use "./' +
+              os.path.basename(sys.argv[0]) + ' groups"', '\n')
+        raise SystemExit
+
+    list_dict = papi_property_list(account_key, cid, gid, verbose)
+
+    print('Properties:')
+    sorted_groups = sorted(list_dict["properties"]["items"], key=lambda x: x['propertyName'])
+    print('\t', 'propertyName;', 'propertyId;', 'Latest;', 'Staging;', 'Production;')
+    for items in sorted_groups:
+        print('\t', items['propertyName'] + ';', items['propertyId'] + ';',
+              str(items['latestVersion']) + ';', str(items['stagingVersion']) + ';',
+              str(items['productionVersion'])+';')
+    print('\n')
+
+
+def papi_property_list(account_key, cid, gid, verbose):
+    """ Not doing any checks because you should call this directly.  There is no value. """
+
+    gssapi = ''
+    if account_key:
+        gssapi = '&accountSwitchKey=' + account_key
+    session = papi_session()
+    result = session.get(urljoin(BASEURL, '/papi/v1/properties?contractId=' + cid +
+                                 '&groupId=' + gid + gssapi))
+
+    # Get result of dictionaries and put them into a list
+    list_dict = result.json()
+
+    verbose_check(verbose, list_dict, 'papi_property_list',
+                  [account_key, cid, gid])
+    success_check(result.status_code, "200", list_dict, verbose)
+
+    return list_dict
+
+
+def property_pairs(account_key, cid, gid, verbose, groups=None):
+    """ Every contract/group pair we were asked for, or all of them in the account.  groups is
+    the group list when the caller already fetched it """
+    if cid:
+        return [(cid, gid)]
+    if groups is None:
+        groups = papi_group_list(account_key, verbose)["groups"]["items"]
+    return [(contract, items['groupId']) for items in groups
+            for contract in items.get('contractIds', [])]
+
+
+def property_lists(account_key, pairs, workers, verbose):
+    """ (contractId, groupId, property) for every property of the contract/group pairs, skipping
+    the pairs whose list cannot be fetched """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def properties(pair):
+        try:
+            return [(pair[0], pair[1], items)
+                    for items in papi_property_list(account_key, pair[0], pair[1],
+                                                    verbose)["properties"]["items"]]
+        except SystemExit:
+            print('\t', 'Skipping the properties of ' + pair[0] + ' ' + pair[1], '\n')
+            return []
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return [prop for found in executor.map(properties, pairs) for prop in found]
+
+
+def papi_property(account_key, cid, gid, pid, vid, verbose):
+    """ Getting a property config information """
+
+    if not cid:
+        print('Contract ID is required to get a property\'s configuration.  '
+              'To get a list of contracts, use "./' +
+              os.path.basename(sys.argv[0]) + ' contracts"', '\n')
+        raise SystemExit
+    if not gid:
+        print('Group ID is required to get a property\'s configuration.  '
+              'To get a list of groups, use "./' +
+              os.path.basename(sys.argv[0]) + ' groups"', '\n')
+        raise SystemExit
+    if not pid:
+        print('Property ID is required to get a property\'s configuration.  '
+              'To get a list of properties, use "./' +
+              os.path.basename(sys.argv[0]) + ' properties"', '\n')
+        raise SystemExit
+
+    gssapi = ''
+    if account_key:
+        gssapi = '&accountSwitchKey=' + account_key
+    if not vid:
+        session = papi_session()
+        result = session.get(urljoin(BASEURL, '/papi/v1/properties/' + pid + '?contractId=' +
+                                     cid + '&groupId=' + gid + gssapi))
+
+        # Get result of dictionaries and put them into a list
+        list_dict = result.json()
+
+        verbose_check(verbose, list_dict, 'papi_property',
+                      [account_key, cid, gid, pid, vid])
+        success_check(result.status_code, "200", list_dict, verbose)
+
+        list_parse(list_dict["properties"]["items"], verbose)
+        print('\n')
+    else:
+        session = papi_session()
+        result = session.get(urljoin(BASEURL, '/papi/v1/properties/' + pid + '/versions/' + vid +
+                                     '?contractId=' + cid + '&groupId=' + gid + gssapi))
+
+        # Get result of dictionaries and put them into a list
+        list_dict = result.json()
+
+        verbose_check(verbose, list_dict, 'papi_property',
+                      [account_key, cid, gid, pid, vid])
+        success_check(result.status_code, "200", list_dict, verbose)
+
+        list_parse(list_dict["versions"]["items"], verbose)
+        print('\n')
+
+
+def papi_edgehostnames(account_key, cid, gid, state_dir, verbose):
+    """ Getting a list of edge Hostnames """
+
+    if not cid:
+        print('Contract ID is required to get a list of Edge Hostnames.  '
+              'To get a list of contracts, use "./' +
+              os.path.basename(sys.argv[0]) + ' contracts"', '\n')
+        raise SystemExit
+    if not gid:
+        print('Group ID is required to get a list of Edge Hostnames.  '
+              'To get a list of groups, use "./' +
+              os.path.basename(sys.argv[0]) + ' groups"', '\n')
+        raise SystemExit
+
+    list_dict = papi_edgehostname_list(account_key, cid, gid, verbose)
+
+    # We have the full list in hand, so refresh the local index used by "patch" for free
+    edgehostname_save(list_dict, cid, gid, state_dir)
+
+    print('accountId:', list_dict["accountId"])
+    print('contractId:', list_dict["contractId"])
+    print('groupId:', list_dict["groupId"])
+    print('Edge Hostnames:')
+    sorted_groups = sorted(list_dict["edgeHostnames"]["items"],
+                           key=lambda x: x['edgeHostnameDomain'])
+    print('\t', 'edgeHostnameDomain;', 'edgeHostnameId;', 'productId;', 'domainPrefix;',
+          'domainSuffix;', 'status;', 'secure;', 'SerialNumber;', 'SlotNumber;', 'Map Domain;')
+    for items in sorted_groups:
+        product_id = items['productId'] if "productId" in items else "n/a"
+        status = items['status'] if "status" in items else "n/a"
+        slot_number = items['mapDetails:slotNumber'] if "mapDetails:slotNumber" in items else "n/a"
+        print(
+            '\t',
+            items['edgeHostnameDomain'] + ';',
+            items['edgeHostnameId']+';',
+            product_id + ';',
+            items['domainPrefix'] + ';',
+            items['domainSuffix'] + ';',
+            status + ';',
+            str(items['secure']) + ';',
+            str(items['mapDetails:serialNumber']) + ';',
+            str(slot_number) + ';',
+            items['mapDetails:mapDomain'] + ';'
+            )
+    print('\n')
+
+
+def papi_edgehostname_list(account_key, cid, gid, verbose):
+    """ Not doing any checks because you should call this directly.  There is no value. """
+
+    gssapi = ''
+    if account_key:
+        gssapi = '&accountSwitchKey=' + account_key
+    session = papi_session()
+    result = session.get(urljoin(BASEURL, '/papi/v1/edgehostnames?contractId=' + cid +
+                                 '&groupId=' + gid + '&options=mapDetails' + gssapi))
+
+    # Get result of dictionaries and put them into a list
+    list_dict = result.json()
+
+    verbose_check(verbose, list_dict, 'papi_edgehostname_list',
+                  [account_key, cid, gid])
+    success_check(result.status_code, "200", list_dict, verbose)
+
+    return list_dict
+
+
+def edgehostname_save(list_dict, cid, gid, state_dir):
+    """ keeping the edge hostnames of a contract/group keyed by edgeHostnameDomain """
+
+    index = {}
+    for items in list_dict["edgeHostnames"]["items"]:
+        index[items["edgeHostnameDomain"]] = items["edgeHostnameId"]
+
+    index_file = os.path.join(state_dir, 'edgehostnames_' + cid + '_' + gid + '.json')
+    os.makedirs(state_dir, exist_ok=True)
+    with open(index_file + '.tmp', 'w') as json_file:
+        json.dump(index, json_file)
+    os.replace(index_file + '.tmp', index_file)
+
+
+def papi_versions(account_key, cid, gid, pid, verbose):
+    """ Getting a list of versions of a config """
+
+    if not cid:
+        print('Contract ID is required to get a list of property versions.  '
+              'To get a list of contracts, use "./' +
+              os.path.basename(sys.argv[0]) + ' contracts"', '\n')
+        raise SystemExit
+    if not gid:
+        print('Group ID is required to get a list of property versions.  '
+              'To get a list of groups, use "./' +
+              os.path.basename(sys.argv[0]) + ' groups"', '\n')
+        raise SystemExit
+    if not pid:
+        print('Property ID is required to get a list of property versions.  '
+              'To get a list of properties, use "./' +
+              os.path.basename(sys.argv[0]) + ' properties"', '\n')
+        raise SystemExit
+
+    list_dict = papi_version_list(account_key, cid, gid, pid, verbose)
+
+    print('accountId:', list_dict["accountId"])
+    print('contractId:', list_dict["contractId"])
+    print('groupId:', list_dict["groupId"])
+    print('Versions:')
+    sorted_groups = sorted(list_dict["versions"]["items"], key=lambda x: x['propertyVersion'],
+                           reverse=True)
+    print('\t', 'propertyVersion;', 'updatedDate;', 'updatedByUser;', 'productionStatus;',
+          'stagingStatus;', 'ruleFormat;', 'notes;')
+    for items in sorted_groups[:10]:
+        note = items['note'] if "note" in items else "n/a"
+        print(
+            '\t',
+            str(items['propertyVersion']) + ';',
+            items['updatedDate'] + ';',
+            items['updatedByUser'] + ';',
+            items['productionStatus'] + ';',
+            items['stagingStatus'] + ';',
+            items['ruleFormat'] + ';',
+            note + ';'
+            )
+    print('\n')
+
+
+def papi_version_list(account_key, cid, gid, pid, verbose):
+    """ Not doing any checks because you should call this directly.  There is no value. """
+
+    gssapi = ''
+    if account_key:
+        gssapi = '&accountSwitchKey=' + account_key
+    session = papi_session()
+    result = session.get(urljoin(BASEURL, '/papi/v1/properties/' + pid + '/versions?contractId=' +
+                                 cid + '&groupId=' + gid + gssapi))
+
+    # Get result of dictionaries and put them into a list
+    list_dict = result.json()
+
+    verbose_check(verbose, list_dict, 'papi_version_list',
+                  [account_key, cid, gid, pid])
+    success_check(result.status_code, "200", list_dict, verbose)
+
+    return list_dict
+
+
+def papi_config(account_key, cid, gid, pid, vid, state_dir, verbose):
+    """ Getting a config detail in JSON format """
+
+    if not cid or not gid or not pid or not vid:
+        print('Contract ID, Group ID, Property ID, and Version ID is required to get a the '
+              'property config details.  This will be printed in JSON format.')
+        raise SystemExit
+
+    gssapi = ''
+    if account_key:
+        gssapi = '&accountSwitchKey=' + account_key
+    session = papi_session()
+    status, list_dict = conditional_get(session,
+                                        urljoin(BASEURL, '/papi/v1/properties/' + pid +
+                                                '/versions/' + vid + '/rules?contractId=' + cid +
+                                                '&groupId=' + gid + gssapi),
+                                        body_file(state_dir, pid, vid, 'rules'))
+
+    verbose_check(verbose, list_dict, 'papi_config',
+                  [account_key, cid, gid, pid, vid])
+    success_check(status, "200", list_dict, verbose)
+
+    print(json.dumps(list_dict))
+
+
+def papi_latest(account_key, cid, gid, pid, version_source, verbose):
+    """ Not doing any checks because you should call this directly.  There is no value. """
+
+    gssapi = ''
+    if account_key:
+        gssapi = '&accountSwitchKey=' + account_key
+    session = papi_session()
+    result = session.get(urljoin(BASEURL, '/papi/v1/properties/' + pid + '?contractId=' + cid +
+                                 '&groupId=' + gid + gssapi))
+
+    # Get result of dictionaries and put them into a list
+    list_dict = result.json()
+
+    verbose_check(verbose, list_dict, 'papi_latest',
+                  [account_key, cid, gid, pid, version_source])
+    success_check(result.status_code, "200", list_dict, verbose)
+
+    if version_source == "PRODUCTION":
+        source_json = json.dumps(list_dict["properties"]["items"][0]["productionVersion"])
+    elif version_source == "STAGING":
+        source_json = json.dumps(list_dict["properties"]["items"][0]["stagingVersion"])
+    else:
+        source_json = json.dumps(list_dict["properties"]["items"][0]["latestVersion"])
+
+    return source_json
+
+
+def papi_etag(account_key, cid, gid, pid, vid, verbose):
+    """ Not doing any checks because you should call this directly.  There is no value. """
+
+    gssapi = ''
+    if account_key:
+        gssapi = '&accountSwitchKey=' + account_key
+    session = papi_session()
+    result = session.get(urljoin(BASEURL, '/papi/v1/properties/' + pid + '/versions/' + vid +
+                                 '?contractId=' + cid + '&groupId=' + gid + gssapi))
+
+    # Get result of dictionaries and put them into a list
+    list_dict = result.json()
+
+    verbose_check(verbose, list_dict, 'papi_etag',
+                  [account_key, cid, gid, pid, vid])
+    success_check(result.status_code, "200", list_dict, verbose)
+
+    return json.dumps(list_dict["versions"]["items"][0]["etag"])
+
+
+def papi_newconfig(account_key, cid, gid, pid, version_source, verbose, report=True):
+    """ Creating a new config from Latest, Staging, or Production """
+
+    if not cid:
+        print('Contract ID is required to create a new property version.  '
+              'To get a list of contracts, use "./' +
+              os.path.basename(sys.argv[0]) + ' contracts"', '\n')
+        raise SystemExit
+    if not gid:
+        print('Group ID is required to create a new property version.  '
+              'To get a list of groups, use "./' +
+              os.path.basename(sys.argv[0]) + ' groups"', '\n')
+        raise SystemExit
+    if not pid:
+        print('Property ID is required to create a new property version.  '
+              'To get a list of properties, use "./' +
+              os.path.basename(sys.argv[0]) + ' properties"', '\n')
+        raise SystemExit
+
+    vid = papi_latest(account_key, cid, gid, pid, version_source, verbose)
+    etag = papi_etag(account_key, cid, gid, pid, vid, verbose)
+
+    data = '{"createFromVersion": ' + vid + ',"createFromVersionEtag": ' + etag + '}'
+    headers = {'Content-Type': 'application/json'}
+
+    gssapi = ''
+    if account_key:
+        gssapi = '&accountSwitchKey=' + account_key
+    session = papi_session()
+    result = session.post(urljoin(BASEURL, '/papi/v1/properties/' + pid +
+                                  '/versions?contractId=' + cid + '&groupId=' + gid +
+                                  gssapi), data=(data), headers=headers)
+
+    # Get result of dictionaries and put them into a list
+    list_dict = result.json()
+
+    verbose_check(verbose, list_dict, 'papi_newconfig',
+                  [account_key, cid, gid, pid, version_source])
+    success_check(result.status_code, "201", list_dict, verbose)
+
+    if list_dict["versionLink"]:
+        string = list_dict["versionLink"]
+        paths = string.split('?')
+        subpaths = paths[0].split('/')
+        print("Your new version is: " + subpaths[6])
+        if report:
+            papi_status(string, 'papi_newconfig', verbose)
+        print('\n')
+        return subpaths[6]
+
+    return None
+
+
+def papi_rules(account_key, cid, gid, pid, vid, state_dir, verbose):
+    """ Not doing any checks because you should call this directly.  There is no value. """
+
+    gssapi = ''
+    if account_key:
+        gssapi = '&accountSwitchKey=' + account_key
+    session = papi_session()
+    status, list_dict = conditional_get(session,
+                                        urljoin(BASEURL, '/papi/v1/properties/' + pid +
+                                                '/versions/' + vid + '/rules?contractId=' + cid +
+                                                '&groupId=' + gid + gssapi),
+                                        body_file(state_dir, pid, vid, 'rules'))
+
+    verbose_check(verbose, list_dict, 'papi_rules',
+                  [account_key, cid, gid, pid, vid])
+    success_check(status, "200", list_dict, verbose)
+
+    # etag is needed for authentication
+    etag = list_dict['etag']
+
+    return (etag, list_dict)
+
+
+def papi_hostnames(account_key, cid, gid, pid, vid, state_dir, verbose):
+    """ Not doing any checks because you should call this directly.  There is no value. """
+
+    gssapi = ''
+    if account_key:
+        gssapi = '&accountSwitchKey=' + account_key
+    session = papi_session()
+    status, list_dict = conditional_get(session,
+                                        urljoin(BASEURL, '/papi/v1/properties/' + pid +
+                                                '/versions/' + vid + '/hostnames?contractId=' +
+                                                cid + '&groupId=' + gid + gssapi),
+                                        body_file(state_dir, pid, vid, 'hostnames'))
+
+    verbose_check(verbose, list_dict, 'papi_hostnames',
+                  [account_key, cid, gid, pid, vid])
+    success_check(status, "200", list_dict, verbose)
+
+    # etag is needed for authentication
+    etag = list_dict['etag']
+    hosts = list_dict['hostnames']['items']
+
+    return (etag, hosts)
+
+
+def papi_activate(account_key, cid, gid, pid, vid, network, email, verbose):
+    """ activate a config to Staging or Production """
+
+    if not pid or not gid or not pid or not vid:
+        print('Contract ID, Group ID, Property ID, Version ID\
+            are required to activate a config.')
+        raise SystemExit
+    if not network or not email:
+        print('Akamai Network, and email address\
+            are required to activate a config.')
+        raise SystemExit
+
+    string = papi_activation(account_key, cid, gid, pid, vid, network, email, verbose)
+    if string:
+        print("Activation Request has been sent!  Checking on status...")
+        papi_status(string, 'papi_activate', verbose)
+
+    print('\n')
+
+
+def papi_activation(account_key, cid, gid, pid, vid, network, email, verbose):
+    """ Not doing any checks because you should call this directly.  There is no value. """
+
+    data = '{"propertyVersion": ' + vid + ',"network": "' + network + '","note": "API activation","notifyEmails": ' + str(json.dumps(email)) + ',"acknowledgeAllWarnings": true,"useFastFallback": false}'
+    if verbose != 'False' and network == "PRODUCTION":
+        # Akamai Employees need Compliance notes when pushing to prod
+        data = '{"propertyVersion": ' + vid + ',"network": "' + network + '","note": "API activation","notifyEmails": ' + str(json.dumps(email)) + ',"acknowledgeAllWarnings": true,"useFastFallback": false,"complianceRecord": {"noncomplianceReason": "NO_PRODUCTION_TRAFFIC"}}'
+        print("You are brave sending a Verbose value of " + verbose)
+        print("I'll format a non-compliant request to bypass an Akamai employee Change\
+            Management requirement, as you wish.")
+        print(data)
+        print(" ")
+    headers = {'Content-Type': 'application/json'}
+
+    gssapi = ''
+    if account_key:
+        gssapi = '&accountSwitchKey=' + account_key
+    session = papi_session()
+    result = session.post(urljoin(BASEURL, '/papi/v1/properties/' + pid +
+                                  '/activations?contractId=' + cid + '&groupId=' + gid +
+                                  gssapi), data=(data), headers=headers)
+
+    # Get result of dictionaries and put them into a list
+    list_dict = result.json()
+
+    verbose_check(verbose, list_dict, 'papi_activation',
+                  [account_key, cid, gid, pid, vid, network, email])
+    success_check(result.status_code, "201", list_dict, verbose)
+
+    return list_dict["activationLink"]
+
+
+def papi_activation_status(path, verbose):
+    """ Not doing any checks because you should call this directly.  There is no value. """
+
+    session = papi_session()
+    result = session.get(urljoin(BASEURL, path))
+
+    # Get result of dictionaries and put them into a list
+    list_dict = result.json()
+
+    verbose_check(verbose, list_dict, 'papi_activation_status', [path])
+    success_check(result.status_code, "200", list_dict, verbose)
+
+    return list_dict["activations"]["items"][0]["status"]
+
+
+def papi_status(path, stype, verbose):
+    """ Not doing any checks because you should call this directly.  There is no value. """
+
+    session = papi_session()
+    result = session.get(urljoin(BASEURL, path))
+
+    # Get result of dictionaries and put them into a list
+    list_dict = result.json()
+
+    verbose_check(verbose, list_dict, 'papi_status', [path, stype])
+    success_check(result.status_code, "200", list_dict, verbose)
+
+    if stype == "papi_activate":
+        list_parse(list_dict["activations"]["items"], verbose)
+    elif stype == "papi_newconfig":
+        list_parse(list_dict["versions"]["items"], verbose)
+    elif stype == "papi_newcpcode":
+        list_parse(list_dict["cpcodes"]["items"], verbose)
+
+
+def papi_session():
+    """ the one signed session every request of this run goes through """
+    with SESSION_LOCK:
+        if 'session' not in PAPI_SESSION:
+            if REPLAY_DIR:
+                session = ReplaySession(REPLAY_DIR, BASEURL)
+            elif TRANSPORT == 'h2':
+                session = H2Session(EdgeGridSigner.from_edgerc(EDGERC, SECTION))
+            else:
+                import requests
+                session = requests.Session()
+                session.auth = EdgeGridSigner.from_edgerc(EDGERC, SECTION)
+            if RECORD_DIR and not REPLAY_DIR:
+                session = RecordingSession(session, RECORD_DIR, BASEURL)
+            PAPI_SESSION['session'] = session
+    return PAPI_SESSION['session']
+
+
+def conditional_get(session, url, store_file):
+    """ GET that sends the ETag of our stored copy and reuses that copy when nothing changed """
+
+    stored = None
+    headers = {}
+    if os.path.isfile(store_file):
+        with open(store_file) as json_file:
+            stored = json.load(json_file)
+        headers['If-None-Match'] = stored['etag']
+
+    result = session.get(url, headers=headers)
+    if result.status_code == 304 and stored:
+        return (200, stored['body'])
+
+    # Get result of dictionaries and put them into a list
+    list_dict = result.json()
+
+    if result.status_code == 200 and result.headers.get('ETag'):
+        os.makedirs(os.path.dirname(store_file), exist_ok=True)
+        with open(store_file + '.tmp', 'w') as json_file:
+            json.dump({'etag': result.headers['ETag'], 'body': list_dict}, json_file)
+        os.replace(store_file + '.tmp', store_file)
+
+    return (result.status_code, list_dict)
+
+
+def body_file(state_dir, pid, vid, kind):
+    """ where the last body of a property version's rules or hostnames is kept """
+    return os.path.join(state_dir, 'bodies', pid + '_' + str(vid) + '_' + kind + '.json')
+
+
+def did_you_mean(name, known):
+    """ " (did you mean ...?)" with the closest of the known names, or nothing """
+    import difflib
+
+    closest = difflib.get_close_matches(name, known, n=1)
+    return ' (did you mean ' + closest[0] + '?)' if closest else ''
+
+
+def verbose_check(verbose, list_dict, function, variables):
+    """ -vv will give more information on the python function """
+    if verbose != 'False' and verbose >= '3':
+        print(list_dict)
+        print("\n")
+    if verbose != 'False' and verbose >= '2':
+        print("function", function, "(", str(variables), ") results\n")
+
+
+def success_check(status, success, list_dict, verbose):
+    """ checking to see if the response code matches what was requested (200/201 usually) """
+    if str(status) == '403':
+        print('You do not have the correct permission for this API call: (' + str(status) + ')')
+        dict_parse(list_dict, verbose)
+        raise SystemExit
+    elif str(status) != success:
+        print('Did not receive a', success, 'response code:', str(status))
+        dict_parse(list_dict, verbose)
+        print("\n")
+        raise SystemExit
+
+
+def list_parse(my_list, verbose):
+    """ printing out a list with key/value pairs, usually when an error occurs """
+    if verbose != 'False' and verbose >= '2':
+        print("function", 'list_parse', "(", my_list, ") results\n")
+
+    temporary_array = (json.dumps(my_list))
+    for obj in json.loads(temporary_array):
+        for key, value in obj.items():
+            if key == 'target':
+                print('\t', key + ':', value)
+            else:
+                print('\t\t', key + ':', value)
+
+
+def dict_parse(my_dict, verbose):
+    """ printing out key/value pairs, usually when an error occurs """
+    if verbose != 'False' and verbose >= '2':
+        print("function", 'dict_parse', "(", my_dict, ") results\n")
+    for key, value in sorted(my_dict.items()):
+        print('\t', key, '=', value)
+
+
+def quote(self):
+    """ I cannot believe I'm hacking this to overcome an API 'requirement' """
+    return '\"' + self + '\"'
@@ -0,0 +1,238 @@
+"""
+Copyright 2018 Akamai Technologies, Inc. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+The "patch" command: CPCode rules and hostnames from a CSV file added to a
+config version, after checking the edge hostnames they point at exist.
+"""
+
+import json
+import os
+from urllib.parse import urljoin
+
+import papi
+from journal import Journal
+from ruletree import RuleTree
+
+
+def edgehostname_index(account_key, cid, gid, state_dir, verbose, refresh=False):
+    """ edgeHostnameDomain lookups for a contract/group, from the local index when we have one """
+
+    index_file = os.path.join(state_dir, 'edgehostnames_' + cid + '_' + gid + '.json')
+    if refresh or not os.path.isfile(index_file):
+        papi.edgehostname_save(papi.papi_edgehostname_list(account_key, cid, gid, verbose), cid,
+                               gid, state_dir)
+
+    with open(index_file) as json_file:
+        return json.load(json_file)
+
+
+def hosts_check(account_key, cid, gid, file, state_dir, verbose):
+    """ making sure every row of the CSV file has a numeric CPCode and an "edgekey name" that is
+    an edge hostname we actually have """
+    import csv
+
+    index = edgehostname_index(account_key, cid, gid, state_dir, verbose)
+    refreshed = False
+    invalid = []
+    missing = []
+    with open(file) as csv_file:
+        csv_reader = csv.reader(csv_file, delimiter=',')
+        line_count = 0
+        for row in csv_reader:
+            if len(row) >= 1: # the len(row) is the number of columns, not the total character count
+                if line_count > 0:
+                    if len(row) < 3:
+                        invalid.append((line_count + 1, 'needs hostname, cpcode and edgekey name'))
+                        line_count += 1
+                        continue
+                    if not row[1].strip().isdigit():
+                        invalid.append((line_count + 1, 'cpcode "' + row[1].strip() +
+                                        '" is not a number'))
+                    cname_to = row[2].strip()
+                    if cname_to not in index and not refreshed:
+                        # The index may simply be older than a new edge hostname, so reload it
+                        # once before calling anything a typo
+                        index = edgehostname_index(account_key, cid, gid, state_dir, verbose,
+                                                   refresh=True)
+                        refreshed = True
+                    if cname_to not in index:
+                        missing.append((line_count + 1, row[0].strip(), cname_to))
+                line_count += 1
+
+    if invalid:
+        print('These rows of ' + file + ' cannot be patched in:')
+        for line, reason in invalid:
+            print('\t', 'line ' + str(line) + ':', reason)
+        print('\n')
+    if missing:
+        print('These rows point at an edge hostname that does not exist in contract ' + cid +
+              ' group ' + gid + ':')
+        for line, cname_from, cname_to in missing:
+            print('\t', 'line ' + str(line) + ':', cname_from, '->',
+                  cname_to + papi.did_you_mean(cname_to, index.keys()))
+        print('\n')
+    if invalid or missing:
+        raise SystemExit
+
+
+def papi_patch(account_key, cid, gid, pid, vid, file, resume, state_dir, verbose):
+    """ Special use case example to update hosts and rules on a config """
+
+    if not cid or not gid or not pid or not vid or not file:
+        print('Contract ID, Group ID, Property ID, Version ID, and a CSV file are required to '
+              'batch patch a config.')
+        raise SystemExit
+
+    # Stop bad rows here instead of after the rules were already saved
+    hosts_check(account_key, cid, gid, file, state_dir, verbose)
+
+    # Rules and hosts are saved separately, so a rerun with --resume only redoes the one that
+    # did not go through instead of adding the same rules twice
+    args = (account_key, cid, gid, pid, vid, file, state_dir, verbose)
+    with Journal(state_dir, 'patch_' + pid + '_' + vid, resume) as journal:
+        failed = journal.run([('rules', papi_patch_rules, args),
+                              ('hostnames', papi_patch_hosts, args)])
+        print('\n')
+        journal.finish(failed)
+    return vid
+
+
+def papi_patch_rules(account_key, cid, gid, pid, vid, file, state_dir, verbose):
+    """ Not doing any checks because you should call this directly.  There is no value. """
+    import csv
+
+    # Get the current saved version of the property config as our base
+    src_rules = papi.papi_rules(account_key, cid, gid, pid, vid, state_dir, verbose)
+
+    # Parse the CSV file to create a list of dictionaries that will be used
+    # to update the CPCodes Rule
+    patch_rules = []
+    with open(file) as csv_file:
+        csv_reader = csv.reader(csv_file, delimiter=',')
+        line_count = 0
+        for row in csv_reader:
+            if len(row) >= 1: # the len(row) is the number of columns, not the total character count
+                if line_count == 0:
+                    print("Processing CSV file for Rules")
+                    line_count += 1
+                else:
+                    patch_rules.append({"op": "add", "path": "/rules/children/0/children/0", "value": {"name": (row[0].strip()), "children": [], "behaviors": [{"name": "cpCode", "options": {"value": {"id": int(row[1].strip()), "name": (row[0].strip()), "description": (row[0].strip()), "products": ["SPM"]}}}], "criteria": [{"name": "hostname", "options": {"matchOperator": "IS_ONE_OF", "values": [(row[0].strip())]}}], "criteriaMustSatisfy": "all"}}.copy())
+                    line_count += 1
+        print("\tProcessed " + str(line_count - 1) + " rows")
+
+    # pulling everything together for the final save
+    rules_etag = src_rules[0]
+
+    # Rules are added through the indexed rule tree, hosts are simply appended below
+    rule_tree = RuleTree(src_rules[1])
+    for operation in patch_rules:
+        if not rule_tree.add(operation["path"], operation["value"]):
+            print('Config version ' + vid + ' has no place at ' + operation["path"] +
+                  ' to add the CPCode rules to.')
+            raise SystemExit
+    rules_data = json.dumps(rule_tree.to_json())
+
+    papi_put_rules(account_key, cid, gid, pid, vid, rules_etag, rules_data, verbose)
+
+
+def papi_put_rules(account_key, cid, gid, pid, vid, rules_etag, rules_data, verbose):
+    """ Not doing any checks because you should call this directly.  There is no value. """
+
+    # Headers for Content-Type and If-Match verification.  If-Match header value must be wrapped
+    # in double quotes.
+    rules_headers = {"Content-Type": "application/json", "If-Match": papi.quote(rules_etag)}
+
+    # DO IT!
+    gssapi = ''
+    if account_key:
+        gssapi = '&accountSwitchKey=' + account_key
+    session = papi.papi_session()
+    result = session.put(urljoin(papi.BASEURL, '/papi/v1/properties/' + pid + '/versions/' + vid +
+                                 '/rules?contractId=' + cid + '&groupId=' + gid +
+                                 gssapi), data=(rules_data), headers=(rules_headers))
+
+    # Get result of dictionaries and put them into a list
+    list_dict = result.json()
+
+    papi.verbose_check(verbose, list_dict, 'papi_put_rules',
+                       [account_key, cid, gid, pid, vid])
+    papi.success_check(result.status_code, "200", list_dict, verbose)
+
+    for keys, values in list_dict.items():
+        if keys == "errors":
+            for value in values:
+                papi.list_parse(value, verbose)
+        elif keys == "propertyVersion":
+            print("No Errors!  You have updated your rules on config version: " +
+                  str(list_dict["propertyVersion"]))
+
+
+def papi_patch_hosts(account_key, cid, gid, pid, vid, file, state_dir, verbose):
+    """ Not doing any checks because you should call this directly.  There is no value. """
+    import csv
+
+    # Get the current saved version of the property config as our base
+    src_hosts = papi.papi_hostnames(account_key, cid, gid, pid, vid, state_dir, verbose)
+
+    # Parse the CSV file to create a list of dictionaries that will be used to
+    # update the CPCodes Rule
+    patch_hosts = []
+    with open(file) as csv_file:
+        csv_reader = csv.reader(csv_file, delimiter=',')
+        line_count = 0
+        for row in csv_reader:
+            if len(row) >= 1: # the len(row) is the number of columns, not the total character count
+                if line_count == 0:
+                    print("Processing CSV file for Hosts")
+                    line_count += 1
+                else:
+                    patch_hosts.append({"cnameType": "EDGE_HOSTNAME", "cnameFrom": (row[0].strip()), "cnameTo": (row[2].strip())}.copy())
+                    line_count += 1
+        print("\tProcessed " + str(line_count - 1) + " rows")
+
+    # pulling everything together for the final save
+    hosts_etag = src_hosts[0]
+
+    # combining hosts lists
+    patch_hosts = src_hosts[1] + patch_hosts
+    hosts_data = json.dumps(patch_hosts)
+
+    # Headers for Content-Type and If-Match verification.  If-Match header value must be wrapped
+    # in double quotes.
+    hosts_headers = {"Content-Type": "application/json", "If-Match": papi.quote(hosts_etag)}
+
+    # DO IT!
+    gssapi = ''
+    if account_key:
+        gssapi = '&accountSwitchKey=' + account_key
+    session = papi.papi_session()
+    result_hosts = session.put(urljoin(papi.BASEURL, '/papi/v1/properties/' + pid + '/versions/' +
+                                       vid + '/hostnames?contractId=' + cid + '&groupId=' + gid +
+                                       gssapi), data=(hosts_data), headers=(hosts_headers))
+
+    # Get result of dictionaries and put them into a list
+    list_dict2 = result_hosts.json()
+
+    papi.verbose_check(verbose, list_dict2, 'papi_patch_hosts',
+                       [account_key, cid, gid, pid, vid, file])
+    papi.success_check(result_hosts.status_code, "200", list_dict2, verbose)
+
+    for keys, values in list_dict2.items():
+        if keys == "errors":
+            for value in values:
+                papi.list_parse(value, verbose)
+        elif keys == "propertyVersion":
+            print("No Errors!  You have updated your hosts on config version: " +
+                  str(list_dict2["propertyVersion"]))
@@ -0,0 +1,120 @@
+"""
+Copyright 2018 Akamai Technologies, Inc. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+The "render" command: one rule tree per row of a variables table, from a
+template config fetched and compiled once.
+"""
+
+import json
+import os
+
+import papi
+import patch
+from journal import Journal
+from ruletree import RuleTemplate
+
+
+def papi_render(account_key, cid, gid, pid, vid, file, version_source, push, workers, resume,
+                state_dir, verbose):
+    """ Rendering a config's rules once per row of a variables table, optionally as new versions """
+    import csv
+
+    if not cid or not gid or not pid or not vid or not file:
+        print('Contract ID, Group ID, Property ID, and Version ID of the template config, and a '
+              'CSV file of variables are required to render rules.')
+        raise SystemExit
+
+    # The template is fetched and compiled once, whatever the number of rows
+    template = RuleTemplate(papi.papi_rules(account_key, cid, gid, pid, vid, state_dir,
+                                            verbose)[1]['rules'])
+
+    # The CSV file is "contract id", "group id", "property id", then one column per variable,
+    # named in the first row after the {{name}} placeholders of the template
+    targets = []
+    invalid = []
+    with open(file) as csv_file:
+        csv_reader = csv.reader(csv_file, delimiter=',')
+        line_count = 0
+        for row in csv_reader:
+            if len(row) >= 1: # the len(row) is the number of columns, not the total character count
+                if line_count == 0:
+                    print("Processing CSV file of variables")
+                    columns = len(row)
+                    variables = [column.strip() for column in row[3:]]
+                    missing = sorted(template.variables - set(variables))
+                    if missing:
+                        print('The template uses variables the CSV file has no column for: ' +
+                              ', '.join(missing), '\n')
+                        raise SystemExit
+                    line_count += 1
+                else:
+                    line_count += 1
+                    if len(row) != columns:
+                        invalid.append((line_count, 'has ' + str(len(row)) + ' columns, the '
+                                        'first row has ' + str(columns)))
+                        continue
+                    values = dict(zip(variables, (column.strip() for column in row[3:])))
+                    try:
+                        targets.append((row[0].strip(), row[1].strip(), row[2].strip(),
+                                        template.render(values)))
+                    except ValueError:
+                        invalid.append((line_count, 'fills a {{name:json}} placeholder with '
+                                        'something that is not JSON'))
+        print("\tRendered " + str(len(targets)) + " rule trees from " +
+              str(len(template.slots)) + " placeholder(s) in config " + pid + " version " + vid,
+              '\n')
+
+    if invalid:
+        print('These rows of ' + file + ' cannot be rendered:')
+        for line, reason in invalid:
+            print('\t', 'line ' + str(line) + ':', reason)
+        print('\n')
+        raise SystemExit
+
+    if not push:
+        os.makedirs(os.path.join(state_dir, 'rendered'), exist_ok=True)
+        print('\t', 'propertyId;', 'rules file;')
+        for target in targets:
+            rules_file = os.path.join(state_dir, 'rendered', target[2] + '_rules.json')
+            with open(rules_file, 'w') as json_file:
+                json.dump({"rules": target[3]}, json_file)
+            print('\t', target[2] + ';', rules_file + ';')
+        print('\n')
+        return
+
+    # Every row becomes a new version of its property, pushed --workers at a time.  Properties
+    # that already got theirs are skipped by --resume instead of getting a second one.
+    with Journal(state_dir, 'render_' + os.path.basename(file), resume) as journal:
+        failed = journal.run([(target[2], papi_render_push,
+                               (account_key, target[0], target[1], target[2], version_source,
+                                target[3], state_dir, verbose)) for target in targets], workers)
+        print('\t', 'propertyId;', 'propertyVersion;')
+        for target in targets:
+            if target[2] in journal:
+                print('\t', target[2] + ';', str(journal.result(target[2])) + ';')
+        print('\n')
+        journal.finish(failed)
+
+
+def papi_render_push(account_key, cid, gid, pid, version_source, rules, state_dir, verbose):
+    """ Not doing any checks because you should call this directly.  There is no value. """
+
+    vid = papi.papi_newconfig(account_key, cid, gid, pid, version_source, verbose)
+    if not vid:
+        raise SystemExit
+    rules_etag = papi.papi_rules(account_key, cid, gid, pid, vid, state_dir, verbose)[0]
+    patch.papi_put_rules(account_key, cid, gid, pid, vid, rules_etag, json.dumps({"rules": rules}),
+                        verbose)
+    return vid
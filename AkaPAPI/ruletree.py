@@ -0,0 +1,164 @@
+"""
+Copyright 2018 Akamai Technologies, Inc. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+The rule tree of a property version, indexed for the patch command, and the
+templates the render command fills in once per row.
+"""
+
+import json
+import re
+
+
+class RuleNode:
+    """ One rule of a rule tree, knowing its parent and children directly """
+    __slots__ = ('parent', 'children', 'fields')
+
+    def __init__(self, rule, parent):
+        self.parent = parent
+        # Every key of the rule in its original order.  "children" only keeps its place there,
+        # its value is rebuilt from self.children
+        self.fields = {key: (None if key == 'children' else value) for key, value in rule.items()}
+        self.children = [RuleNode(child, self) for child in rule.get('children', [])]
+
+    @property
+    def name(self):
+        """ the rule name, as shown in Property Manager """
+        return self.fields.get('name')
+
+    @property
+    def path(self):
+        """ the JSON path of the rule, worked out from where it sits now so adds never have to
+        renumber the rules after it """
+        if self.parent is None:
+            return '/rules'
+        return self.parent.path + '/children/' + str(self.parent.children.index(self))
+
+    def to_json(self):
+        """ the rule back in PAPI JSON form """
+        return {key: ([child.to_json() for child in self.children] if key == 'children' else value)
+                for key, value in self.fields.items()}
+
+
+class RuleTree:
+    """ A PAPI rule tree with every rule reachable by its JSON path and indexed by its name """
+    __slots__ = ('top', 'root', 'names')
+
+    def __init__(self, list_dict):
+        # Everything around the rules (etag, ruleFormat, comments...) is kept as is
+        self.top = list_dict
+        self.root = RuleNode(list_dict['rules'], None)
+        self.names = {}
+        self._index(self.root)
+
+    def get(self, path):
+        """ the rule at a JSON path such as /rules/children/0, or None """
+        steps = path.split('/')
+        if steps[:2] != ['', 'rules'] or len(steps) % 2 or set(steps[2::2]) - {'children'}:
+            return None
+        node = self.root
+        for position in steps[3::2]:
+            if not position.isdigit() or int(position) >= len(node.children):
+                return None
+            node = node.children[int(position)]
+        return node
+
+    def find(self, name):
+        """ every rule with this name """
+        return self.names.get(name, [])
+
+    def add(self, path, rule):
+        """ adding a rule the way a JSON Patch "add" would, e.g. at /rules/children/0/children/0 """
+        if '/children/' not in path:
+            return None
+        parent_path, position = path.rsplit('/children/', 1)
+        parent = self.get(parent_path)
+        if parent is None:
+            return None
+        if position == '-':
+            position = str(len(parent.children))
+        if not position.isdigit() or int(position) > len(parent.children):
+            return None
+
+        # Paths are not stored, so the rules after the new one need no reindexing
+        node = RuleNode(rule, parent)
+        parent.children.insert(int(position), node)
+        if 'children' not in parent.fields:
+            parent.fields['children'] = None
+        self._index(node)
+        return node
+
+    def to_json(self):
+        """ the whole rule tree back in PAPI JSON form """
+        return {key: (self.root.to_json() if key == 'rules' else value)
+                for key, value in self.top.items()}
+
+    def _index(self, node):
+        self.names.setdefault(node.name, []).append(node)
+        for child in node.children:
+            self._index(child)
+
+
+class RuleTemplate:
+    """ A rule tree with {{variable}} placeholders, compiled once and rendered for many rows """
+    __slots__ = ('rules', 'slots', 'variables')
+    PLACEHOLDER = re.compile(r'{{\s*([\w.-]+(?::json)?)\s*}}')
+
+    def __init__(self, rules):
+        self.rules = rules
+        # (path, parts) for every string holding a placeholder, the parts alternate between
+        # literal text and variable names, each with its ":json" if it has one
+        self.slots = []
+        self.variables = set()
+        self._compile(rules, ())
+
+    def render(self, values):
+        """ the rules with every placeholder filled from values.  Only the lists and objects on
+        the way to a placeholder are copied, every other subtree is shared with the template """
+        copies = {(): self._copy(self.rules)}
+        for path, parts in self.slots:
+            parent = copies[()]
+            for depth in range(1, len(path)):
+                if path[:depth] not in copies:
+                    copies[path[:depth]] = self._copy(parent[path[depth - 1]])
+                    parent[path[depth - 1]] = copies[path[:depth]]
+                parent = copies[path[:depth]]
+            parent[path[-1]] = self._fill(parts, values)
+        return copies[()]
+
+    def _compile(self, value, path):
+        if isinstance(value, dict):
+            for key, item in value.items():
+                self._compile(item, path + (key,))
+        elif isinstance(value, list):
+            for position, item in enumerate(value):
+                self._compile(item, path + (position,))
+        elif isinstance(value, str) and self.PLACEHOLDER.search(value):
+            parts = self.PLACEHOLDER.split(value)
+            self.slots.append((path, parts))
+            self.variables.update(part.split(':')[0] for part in parts[1::2])
+
+    @staticmethod
+    def _copy(value):
+        return dict(value) if isinstance(value, dict) else list(value)
+
+    @staticmethod
+    def _fill(parts, values):
+        # Values stay text unless a value is nothing but one {{name:json}} placeholder, which
+        # takes the JSON type of what fills it, so "{{port:json}}" can become 80 and
+        # "{{secure:json}}" true.  A value that is not JSON raises ValueError.
+        if len(parts) == 3 and not parts[0] and not parts[2] and parts[1].endswith(':json'):
+            return json.loads(values[parts[1].split(':')[0]])
+        return ''.join(values[part.split(':')[0]] if position % 2 else part
+                       for position, part in enumerate(parts))
@@ -0,0 +1,209 @@
+"""
+Copyright 2018 Akamai Technologies, Inc. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+The sessions papi.py can send its requests through besides requests.Session:
+HTTP/2 with httpx, and recording every exchange to a directory or replaying
+one instead of the network.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+from collections import Counter
+from urllib.parse import urlparse
+
+
+def transport_errors():
+    """ the exceptions a session raises when a request got no response at all """
+    import requests
+    errors = (requests.ConnectionError, requests.Timeout)
+    # httpx is only loaded when --transport h2 asked for it
+    if 'httpx' in sys.modules:
+        errors += (sys.modules['httpx'].TransportError,)
+    return errors
+
+
+def recording_name(method, url, data):
+    """ the file name (less its sequence number) an exchange is recorded under.  The host is left
+    out so a recording replays whatever .edgerc it was made with """
+    parts = urlparse(url)
+    request = method + ' ' + parts.path + '?' + parts.query + '\n'
+    digest = hashlib.sha256(request.encode('utf8') + (data.encode('utf8') if isinstance(data, str)
+                                                      else data or b'')).hexdigest()
+    return method + re.sub('[^A-Za-z0-9]+', '_', parts.path)[:80] + '_' + digest[:12]
+
+
+class H2Session:
+    """ The get/post/put of requests.Session that the papi_* functions use, multiplexed over a
+    single HTTP/2 connection by httpx """
+
+    def __init__(self, signer):
+        try:
+            import httpx
+        except ImportError:
+            print('The h2 transport needs httpx with HTTP/2 support.  '
+                  'Install it with: pip3 install "httpx[http2]"', '\n')
+            raise SystemExit
+
+        def sign(request):
+            request.headers['Authorization'] = signer.sign(request.method, str(request.url),
+                                                           request.headers, request.content)
+            return request
+
+        # One connection is enough, every concurrent request becomes a stream on it
+        self.client = httpx.Client(http2=True, auth=sign, timeout=60,
+                                   limits=httpx.Limits(max_connections=1))
+        self.goaway = httpx.RemoteProtocolError
+
+    def get(self, url, headers=None):
+        """ requests.Session.get """
+        try:
+            return self.client.get(url, headers=headers)
+        except self.goaway:
+            # A server may close the connection (GOAWAY) with streams still unanswered,
+            # a GET is safe to send again on a fresh one
+            return self.client.get(url, headers=headers)
+
+    def post(self, url, data=None, headers=None):
+        """ requests.Session.post """
+        return self.client.post(url, content=data, headers=headers)
+
+    def put(self, url, data=None, headers=None):
+        """ requests.Session.put """
+        return self.client.put(url, content=data, headers=headers)
+
+
+class RecordingSession:
+    """ One of the sessions above, writing every request and response that goes through it to a
+    directory ReplaySession can answer the same commands from later """
+
+    def __init__(self, session, directory, baseurl):
+        self.session = session
+        self.directory = directory
+        # Recorded urls leave the host out, so a recording replays whatever .edgerc it was made with
+        self.baseurl = baseurl
+        self.counts = Counter()
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def get(self, url, headers=None):
+        """ requests.Session.get """
+        return self._record('GET', url, None, headers)
+
+    def post(self, url, data=None, headers=None):
+        """ requests.Session.post """
+        return self._record('POST', url, data, headers)
+
+    def put(self, url, data=None, headers=None):
+        """ requests.Session.put """
+        return self._record('PUT', url, data, headers)
+
+    def _record(self, method, url, data, headers):
+        # A 304 could not be replayed into an empty --state-dir, so every recorded GET asks for
+        # the whole body
+        headers = {key: value for key, value in (headers or {}).items()
+                   if key.lower() != 'if-none-match'}
+        if method == 'GET':
+            result = self.session.get(url, headers=headers)
+        else:
+            result = getattr(self.session, method.lower())(url, data=data, headers=headers)
+
+        # The same request made again (an activation being polled) is numbered, and replayed,
+        # in the order it was made
+        name = recording_name(method, url, data)
+        with self.lock:
+            self.counts[name] += 1
+            sequence = self.counts[name]
+        recording = {"method": method,
+                     "url": url[len(self.baseurl):] if url.startswith(self.baseurl) else url,
+                     "body": data.decode('utf8') if isinstance(data, bytes) else data,
+                     "status": result.status_code,
+                     "headers": {header: result.headers[header]
+                                 for header in ('ETag', 'Content-Type', 'Location')
+                                 if header in result.headers},
+                     "response": result.text}
+        recording_file = os.path.join(self.directory, name + '_' + str(sequence) + '.json')
+        with open(recording_file + '.tmp', 'w') as json_file:
+            json.dump(recording, json_file, indent=2)
+        os.replace(recording_file + '.tmp', recording_file)
+        return result
+
+
+class ReplaySession:
+    """ The get/post/put of a session, answered from what a RecordingSession wrote down instead
+    of the network """
+
+    def __init__(self, directory, baseurl):
+        if not os.path.isdir(directory):
+            print('There are no recordings in --replay ' + directory + '.  Make them by running '
+                  'the same commands with --record ' + directory, '\n')
+            raise SystemExit
+        self.directory = directory
+        self.baseurl = baseurl
+        self.counts = Counter()
+        self.lock = threading.Lock()
+
+    def get(self, url, headers=None):
+        """ requests.Session.get """
+        return self._replay('GET', url, None, headers)
+
+    def post(self, url, data=None, headers=None):
+        """ requests.Session.post """
+        return self._replay('POST', url, data, headers)
+
+    def put(self, url, data=None, headers=None):
+        """ requests.Session.put """
+        return self._replay('PUT', url, data, headers)
+
+    def _replay(self, method, url, data, headers):
+        name = recording_name(method, url, data)
+        with self.lock:
+            self.counts[name] += 1
+            sequence = self.counts[name]
+
+        # Asked more often than it was recorded, the last answer is given again
+        while sequence > 1 and not os.path.isfile(
+                os.path.join(self.directory, name + '_' + str(sequence) + '.json')):
+            sequence -= 1
+        recording_file = os.path.join(self.directory, name + '_' + str(sequence) + '.json')
+        if not os.path.isfile(recording_file):
+            print('Nothing was recorded for ' + method + ' ' + url[len(self.baseurl):] + ' in ' +
+                  self.directory, '\n')
+            raise SystemExit
+        with open(recording_file) as json_file:
+            recording = json.load(json_file)
+
+        # Conditional GETs still get their 304 when they already hold the recorded body
+        etag = recording["headers"].get('ETag')
+        if etag and recording["status"] == 200 and (headers or {}).get('If-None-Match') == etag:
+            return ReplayResponse(304, recording["headers"], '')
+        return ReplayResponse(recording["status"], recording["headers"], recording["response"])
+
+
+class ReplayResponse:
+    """ The parts of a response the papi_* functions read """
+    __slots__ = ('status_code', 'headers', 'text')
+
+    def __init__(self, status_code, headers, text):
+        self.status_code = status_code
+        self.headers = headers
+        self.text = text
+
+    def json(self):
+        """ requests.Response.json """
+        return json.loads(self.text)
@@ -0,0 +1,117 @@
+"""
+Copyright 2018 Akamai Technologies, Inc. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+EdgeGrid request signing for the sessions papi.py sends its requests through.
+"""
+
+import base64
+import hashlib
+import hmac
+import os
+import re
+import time
+import uuid
+from urllib.parse import urlparse
+
+
+class EdgeGridSigner:
+    """ EdgeGrid request signing with everything that only depends on the credentials worked
+    out once, giving the same Authorization header as akamai.edgegrid.EdgeGridAuth.  Any
+    callable will do as the auth of a requests.Session, so there is no need for AuthBase. """
+
+    def __init__(self, client_token, client_secret, access_token, headers_to_sign=(),
+                 max_body=131072):
+        self.header_start = ('EG1-HMAC-SHA256 client_token=' + client_token +
+                             ';access_token=' + access_token + ';timestamp=')
+        self.headers_to_sign = [header.lower() for header in headers_to_sign]
+        self.max_body = max_body
+        self.spaces = re.compile('\\s+')
+        # HMAC keyed with the client secret, copied for every new signing key
+        self.secret_mac = hmac.new(client_secret.encode('utf8'), digestmod=hashlib.sha256)
+        # The signing key only changes with the (one second) timestamp, so keep the last one
+        self.signing_mac = (None, None)
+        # Akamai CLI version details the upstream library adds to the User-Agent header
+        self.user_agent = ''
+        if os.getenv('AKAMAI_CLI') and os.getenv('AKAMAI_CLI_VERSION'):
+            self.user_agent += ' AkamaiCLI/' + os.getenv('AKAMAI_CLI_VERSION')
+        if os.getenv('AKAMAI_CLI_COMMAND') and os.getenv('AKAMAI_CLI_COMMAND_VERSION'):
+            self.user_agent += (' AkamaiCLI-' + os.getenv('AKAMAI_CLI_COMMAND') + '/' +
+                                os.getenv('AKAMAI_CLI_COMMAND_VERSION'))
+
+    @staticmethod
+    def from_edgerc(edgerc, section):
+        """ a signer for the credentials in a section of an EdgeRc """
+        return EdgeGridSigner(edgerc.get(section, 'client_token'),
+                              edgerc.get(section, 'client_secret'),
+                              edgerc.get(section, 'access_token'),
+                              edgerc.getlist(section, 'headers_to_sign'),
+                              edgerc.getint(section, 'max_body'))
+
+    def sign(self, method, url, headers, body, timestamp=None, nonce=None):
+        """ the Authorization header value for a request """
+        if timestamp is None:
+            timestamp = time.strftime('%Y%m%dT%H:%M:%S+0000', time.gmtime())
+        if nonce is None:
+            nonce = uuid.uuid4()
+        auth_header = self.header_start + timestamp + ';nonce=' + str(nonce) + ';'
+
+        if self.user_agent:
+            if 'User-Agent' in headers:
+                headers['User-Agent'] += self.user_agent
+            else:
+                headers['User-Agent'] = self.user_agent.strip()
+
+        parsed_url = urlparse(url)
+        content_hash = ''
+        if method == 'POST' and body:
+            if isinstance(body, str):
+                body = body.encode('utf8')
+            content_hash = base64.b64encode(
+                hashlib.sha256(body[:self.max_body]).digest()).decode('utf8')
+        data_to_sign = '\t'.join([
+            method,
+            parsed_url.scheme,
+            headers.get('Host') or parsed_url.netloc,
+            parsed_url.path + (';' + parsed_url.params if parsed_url.params else '') +
+            ('?' + parsed_url.query if parsed_url.query else ''),
+            '\t'.join([header + ':' + self.spaces.sub(' ', headers[header].strip())
+                       for header in self.headers_to_sign if header in headers]),
+            content_hash,
+            auth_header
+        ])
+
+        signing_timestamp, signing_mac = self.signing_mac
+        if signing_timestamp != timestamp:
+            secret_mac = self.secret_mac.copy()
+            secret_mac.update(timestamp.encode('utf8'))
+            signing_mac = hmac.new(base64.b64encode(secret_mac.digest()), digestmod=hashlib.sha256)
+            self.signing_mac = (timestamp, signing_mac)
+        signature_mac = signing_mac.copy()
+        signature_mac.update(data_to_sign.encode('utf8'))
+
+        return auth_header + 'signature=' + base64.b64encode(signature_mac.digest()).decode('utf8')
+
+    def handle_redirect(self, result, **_):
+        """ signing the request again for the url we are redirected to """
+        if result.is_redirect:
+            result.request.headers['Authorization'] = self.sign(
+                result.request.method, result.headers['location'],
+                result.request.headers.copy(), result.request.body)
+
+    def __call__(self, request):
+        request.headers['Authorization'] = self.sign(request.method, request.url,
+                                                     request.headers, request.body)
+        request.register_hook('response', self.handle_redirect)
+        return request
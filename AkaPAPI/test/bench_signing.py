@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Copyright 2018 Akamai Technologies, Inc. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Checks that AkaPAPI's EdgeGridSigner builds the same Authorization header as
+akamai.edgegrid, then measures how many signatures per second each one makes.
+"""
+
+import os
+import sys
+import tempfile
+import time
+from argparse import ArgumentParser
+from akamai.edgegrid import EdgeGridAuth, EdgeRc
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from signer import EdgeGridSigner # pylint: disable=wrong-import-position
+
+EDGERC_TEXT = """[default]
+host = akab-xxxxxxxxxxxxxxxx-xxxxxxxxxxxxxxxx.luna.akamaiapis.net
+client_token = akab-client-token-xxx-xxxxxxxxxxxxxxxx
+client_secret = SOMESECRET/xxxxxxxxxxxxxxxxxxxxxxxxxxxxxx=
+access_token = akab-access-token-xxx-xxxxxxxxxxxxxxxx
+headers_to_sign = X-Test1,X-Test2
+max_body = 2048
+"""
+
+BASEURL = 'https://akab-xxxxxxxxxxxxxxxx-xxxxxxxxxxxxxxxx.luna.akamaiapis.net'
+
+# The kinds of requests the papi_* functions send, plus the corners of the signing rules
+REQUESTS = [
+    ('GET', '/papi/v1/groups', {}, None),
+    ('GET', '/papi/v1/properties?contractId=ctr_1&groupId=grp_1&accountSwitchKey=K', {}, None),
+    ('GET', '/papi/v1/properties/prp_1/versions/3/rules;v=1?contractId=ctr_1', {}, None),
+    ('GET', '/papi/v1/groups', {'X-Test1': 'a   b \t c', 'X-Test2': 'c'}, None),
+    ('GET', '/papi/v1/groups', {'Host': 'other.luna.akamaiapis.net'}, None),
+    ('POST', '/papi/v1/cpcodes?contractId=ctr_1&groupId=grp_1',
+     {'Content-Type': 'application/json'}, '{"productId": "prd_SPM","cpcodeName": "x"}'),
+    ('POST', '/papi/v1/properties/prp_1/activations', {}, 'x' * 5000),
+    ('POST', '/papi/v1/properties/prp_1/activations', {}, ''),
+    ('PUT', '/papi/v1/properties/prp_1/versions/3/rules', {'If-Match': '"e1"'}, '{"rules": {}}'),
+]
+
+
+def prepare(method, path, headers, body):
+    """ a prepared requests.Request like the ones a Session hands to its auth """
+    return requests.Request(method, BASEURL + path, headers=headers, data=body).prepare()
+
+
+def upstream_header(edgerc, request, timestamp, nonce):
+    """ the Authorization header akamai.edgegrid builds """
+    auth = EdgeGridAuth.from_edgerc(edgerc, 'default')
+    # edgegrid-python 1.x signs on EdgeGridAuth itself, 2.x on its EdgeGridAuthHeaders
+    return getattr(auth, 'ah', auth).make_auth_header(request, timestamp, nonce)
+
+
+def rate(count, sign):
+    """ signatures per second """
+    start = time.perf_counter()
+    for _ in range(count):
+        sign()
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    """ compare, then benchmark """
+    parser = ArgumentParser(description='EdgeGrid signing check and benchmark')
+    parser.add_argument('--count', type=int, default=20000,
+                        help='How many signatures to time for each signer')
+    args = parser.parse_args()
+
+    with tempfile.NamedTemporaryFile('w', suffix='.edgerc', delete=False) as edgerc_file:
+        edgerc_file.write(EDGERC_TEXT)
+    edgerc = EdgeRc(edgerc_file.name)
+    signer = EdgeGridSigner.from_edgerc(edgerc, 'default')
+
+    mismatches = 0
+    timestamps = ['20181011T12:00:00+0000', '20181011T12:00:00+0000', '20181011T12:00:01+0000']
+    for timestamp in timestamps:
+        for method, path, headers, body in REQUESTS:
+            nonce = 'nonce-' + method + '-' + str(len(path))
+            expected = upstream_header(edgerc, prepare(method, path, headers, body), timestamp,
+                                       nonce)
+            request = prepare(method, path, headers, body)
+            actual = signer.sign(request.method, request.url, request.headers, request.body,
+                                 timestamp, nonce)
+            if actual != expected:
+                mismatches += 1
+                print('MISMATCH', method, path)
+                print('\t', 'upstream:', expected)
+                print('\t', 'AkaPAPI: ', actual)
+    print('Authorization headers compared:', len(timestamps) * len(REQUESTS),
+          'mismatches:', mismatches)
+
+    request = prepare('GET', '/papi/v1/properties?contractId=ctr_1&groupId=grp_1', {}, None)
+    upstream_auth = EdgeGridAuth.from_edgerc(edgerc, 'default')
+    print('Signatures per second (' + str(args.count) + ' GET requests):')
+    print('\t', 'EdgeGridAuth.from_edgerc per request: %10.0f' %
+          rate(args.count, lambda: EdgeGridAuth.from_edgerc(edgerc, 'default')(request)))
+    print('\t', 'EdgeGridAuth reused:                  %10.0f' %
+          rate(args.count, lambda: upstream_auth(request)))
+    print('\t', 'EdgeGridSigner reused:                %10.0f' %
+          rate(args.count, lambda: signer(request)))
+
+    os.remove(edgerc_file.name)
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Copyright 2018 Akamai Technologies, Inc. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Times how long AkaPAPI.py takes to start on top of a bare python and, on
+python 3.7 and later, lists the slowest imports "python -X importtime" reports.
+It fails when AkaPAPI.py -h goes over its startup budget or loads a module no
+command has asked for yet.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+from argparse import ArgumentParser
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'AkaPAPI.py')
+
+# Only the command that needs one of these may import it, the command modules included
+NOT_AT_STARTUP = ('requests', 'akamai', 'sqlite3', 'httpx', 'concurrent', 'csv', 'inspect',
+                  'papi', 'deploy', 'history', 'names', 'patch', 'render', 'journal', 'sessions',
+                  'signer', 'ruletree')
+
+# Runs AkaPAPI.py in this python and writes every module it loaded after a marker line.  Works
+# on every python, unlike -X importtime.
+LOADED = """import os, runpy, sys
+sys.path.insert(0, os.path.dirname(%r))
+sys.argv = [%r] + %r
+try:
+    runpy.run_path(%r, run_name='__main__')
+except SystemExit:
+    pass
+sys.stderr.write('\\n--modules--\\n' + '\\n'.join(sorted(sys.modules)) + '\\n')
+"""
+
+
+def output(command, env):
+    """ what a command writes to stderr, subprocess.run is not there before python 3.5 """
+    process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                               env=env, universal_newlines=True)
+    return process.communicate()[1]
+
+
+def wall(command, runs, env):
+    """ median milliseconds a command takes, after one run to fill __pycache__ """
+    subprocess.call(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=env)
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.call(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=env)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def loaded(arguments, env):
+    """ every module AkaPAPI.py has loaded by the time it exits """
+    code = LOADED % (SCRIPT, SCRIPT, arguments, SCRIPT)
+    return output([sys.executable, '-c', code], env).split('\n--modules--\n', 1)[-1].split()
+
+
+def importtime(arguments, env):
+    """ (module, cumulative us) for everything the script imports """
+    found = []
+    for line in output([sys.executable, '-X', 'importtime', SCRIPT] + arguments,
+                       env).splitlines():
+        if line.startswith('import time:') and '|' in line and 'cumulative' not in line:
+            _, cumulative_us, module = line[len('import time:'):].split('|')
+            if not module.startswith('  '):
+                found.append((module.strip(), int(cumulative_us)))
+    return found
+
+
+def main():
+    """ time -h and -V, then check -h against the budget and what it imported """
+    parser = ArgumentParser(description='AkaPAPI startup benchmark')
+    parser.add_argument('--runs', type=int, default=15, help='How many runs to take the median of')
+    parser.add_argument('--budget', type=float, default=100,
+                        help='Most milliseconds AkaPAPI.py -h may add to a bare python start')
+    args = parser.parse_args()
+
+    # A user's machine keeps the compiled modules in __pycache__, so measure with them
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+
+    bare = wall([sys.executable, '-c', 'pass'], args.runs, env)
+    print('Startup in ms (median of ' + str(args.runs) + ' runs):')
+    print('\t', 'python -c pass: %8.1f' % bare)
+    overhead = {}
+    for arguments in (['-h'], ['-V']):
+        took = wall([sys.executable, SCRIPT] + arguments, args.runs, env)
+        overhead[arguments[0]] = took - bare
+        print('\t', ('AkaPAPI.py ' + ' '.join(arguments) + ':').ljust(15), '%8.1f' % took,
+              '(+%.1f)' % (took - bare))
+
+    if sys.version_info >= (3, 7):
+        print('Slowest imports of AkaPAPI.py -h (cumulative ms):')
+        for module, cumulative_us in sorted(importtime(['-h'], env),
+                                            key=lambda item: -item[1])[:8]:
+            print('\t', module.ljust(30), '%8.1f' % (cumulative_us / 1000))
+    else:
+        print('Slowest imports need python 3.7 or later for -X importtime, skipped.')
+
+    modules = loaded(['-h'], env)
+    early = sorted(module for module in modules if module.split('.')[0] in NOT_AT_STARTUP)
+    if early:
+        print('Imported before any command needed them:', ', '.join(early))
+    print('Checked ' + str(len(modules)) + ' modules AkaPAPI.py -h loaded, imports at startup:',
+          'FAILED' if early or not modules else 'OK')
+    within = overhead['-h'] <= args.budget
+    print('Startup overhead of -h %.1f ms, budget %.1f ms:' % (overhead['-h'], args.budget),
+          'OK' if within else 'OVER')
+    if early or not modules or not within:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
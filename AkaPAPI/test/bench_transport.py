@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Copyright 2018 Akamai Technologies, Inc. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Sends the same burst of concurrent GET requests through AkaPAPI's h1
+(requests) and h2 (httpx) transports and compares throughput and latency.
+Point --edgerc at a section whose host is a local HTTP/2 server to measure
+the transports without the API in the way.
+"""
+
+import os
+import sys
+import time
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+from akamai.edgegrid import EdgeRc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import papi # pylint: disable=wrong-import-position
+
+
+def burst(transport, url, count, workers):
+    """ (seconds, latencies, failures) for count GETs with workers in flight """
+    papi.TRANSPORT = transport
+    papi.PAPI_SESSION.clear()
+    session = papi.papi_session()
+
+    def fetch(_):
+        start = time.perf_counter()
+        result = session.get(url)
+        return (time.perf_counter() - start, result.status_code)
+
+    # One request first so connection setup is not counted against either transport
+    session.get(url)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(fetch, range(count)))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for latency, status in results)
+    failures = len([status for latency, status in results if status != 200])
+    return (elapsed, latencies, failures)
+
+
+def main():
+    """ run the burst over both transports """
+    parser = ArgumentParser(description='AkaPAPI h1 vs h2 transport benchmark')
+    parser.add_argument('--edgerc', default=os.path.expanduser('~') + '/.edgerc')
+    parser.add_argument('--section', default='default')
+    parser.add_argument('--path', default='/papi/v1/groups',
+                        help='The GET request to repeat')
+    parser.add_argument('--count', type=int, default=200, help='How many requests per transport')
+    parser.add_argument('--workers', type=int, default=20, help='How many requests in flight')
+    args = parser.parse_args()
+
+    papi.EDGERC = EdgeRc(args.edgerc)
+    papi.SECTION = args.section
+    papi.BASEURL = 'https://%s' % papi.EDGERC.get(args.section, 'host')
+    url = urljoin(papi.BASEURL, args.path)
+
+    print(str(args.count) + ' x GET ' + args.path + ' with ' + str(args.workers) +
+          ' in flight:')
+    print('\t', 'transport;', 'requests/s;', 'p50 ms;', 'p99 ms;', 'failures;')
+    for transport in ('h1', 'h2'):
+        elapsed, latencies, failures = burst(transport, url, args.count, args.workers)
+        print('\t', transport + ';',
+              '%.0f;' % (args.count / elapsed),
+              '%.1f;' % (latencies[len(latencies) // 2] * 1000),
+              '%.1f;' % (latencies[min(len(latencies) - 1, len(latencies) * 99 // 100)] * 1000),
+              str(failures) + ';')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Copyright 2018 Akamai Technologies, Inc. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Checks offline that AkaPAPI's RuleTree gives back the rule tree it was built
+from, adds rules where a JSON Patch "add" would, and keeps its path and name
+indexes right after every add.
+"""
+
+import copy
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from ruletree import RuleTree # pylint: disable=wrong-import-position
+
+# Dictionaries only keep their key order from Python 3.7 on, so older ones compare sorted
+SORTED = sys.version_info < (3, 7)
+
+# A big CSV file for the patch command, and a time limit far above what adding it takes
+LARGE_ROWS = 5000
+LARGE_SECONDS = 2
+
+RULES = {
+    "accountId": "act_1",
+    "etag": "abc",
+    "rules": {
+        "name": "default",
+        "children": [
+            {"name": "Performance", "children": [{"name": "Compression", "children": [],
+                                                  "criteria": [], "behaviors": []}],
+             "behaviors": [], "criteria": [], "criteriaMustSatisfy": "all"},
+            {"name": "Offload", "behaviors": [{"name": "caching"}], "children": []},
+        ],
+        "behaviors": [{"name": "origin", "options": {"hostname": "origin.example.com"}}],
+        "options": {"is_secure": False},
+    },
+    "ruleFormat": "latest",
+}
+
+
+def rule(name):
+    """ a small rule to add """
+    return {"name": name, "children": [], "behaviors": [], "criteria": []}
+
+
+def json_add(tree, path, value):
+    """ what a JSON Patch "add" would make of the plain JSON """
+    parent, position = path.rsplit('/children/', 1)
+    node = tree
+    for step in parent.strip('/').split('/'):
+        node = node[int(step)] if isinstance(node, list) else node[step]
+    children = node.setdefault('children', [])
+    children.insert(len(children) if position == '-' else int(position), value)
+
+
+def rule_paths(rule_tree):
+    """ every rule by the JSON path found by walking the tree """
+    paths = {}
+
+    def walk(node, path):
+        paths[path] = node
+        for position, child in enumerate(node.children):
+            walk(child, path + '/children/' + str(position))
+
+    walk(rule_tree.root, '/rules')
+    return paths
+
+
+def indexed_right(rule_tree):
+    """ every path leads to the rule found by walking the tree, and every name is indexed """
+    expected = rule_paths(rule_tree)
+    names = {}
+    for node in expected.values():
+        names.setdefault(node.name, set()).add(id(node))
+    return (all(rule_tree.get(path) is node and node.path == path
+                for path, node in expected.items()) and
+            {name: set(id(node) for node in nodes)
+             for name, nodes in rule_tree.names.items() if nodes} == names)
+
+
+def main():
+    """ run every check and print how many failed """
+    failed = 0
+
+    def check(description, passed):
+        nonlocal failed
+        print('\t', description.ljust(55), 'OK' if passed else 'FAILED')
+        failed += 0 if passed else 1
+
+    print('Rule tree checks:')
+    rule_tree = RuleTree(copy.deepcopy(RULES))
+    check('round trip gives the same JSON',
+          json.dumps(rule_tree.to_json(), sort_keys=SORTED) ==
+          json.dumps(RULES, sort_keys=SORTED))
+    check('rules keep no raw children list',
+          all(value is None for node in rule_paths(rule_tree).values()
+              for key, value in node.fields.items() if key == 'children'))
+    check('paths and names indexed', indexed_right(rule_tree))
+    check('get by path', rule_tree.get('/rules/children/0/children/0').name == 'Compression')
+    check('find by name', [node.path for node in rule_tree.find('Offload')] ==
+          ['/rules/children/1'])
+
+    expected = copy.deepcopy(RULES)
+    # "Last" has no children key at all, so the rule added under it has to create one
+    for path, value in (('/rules/children/0', rule('First')),
+                        ('/rules/children/-', {"name": "Last", "behaviors": []}),
+                        ('/rules/children/1/children/1', rule('Nested')),
+                        ('/rules/children/2/children/0', rule('Into empty')),
+                        ('/rules/children/3/children/0', rule('Into no children'))):
+        added = rule_tree.add(path, copy.deepcopy(value))
+        json_add(expected, path, copy.deepcopy(value))
+        check('add ' + value["name"] + ' at ' + path, added is not None and
+              json.dumps(rule_tree.to_json(), sort_keys=SORTED) ==
+              json.dumps(expected, sort_keys=SORTED))
+        check('indexes after adding ' + value["name"], indexed_right(rule_tree))
+
+    before = json.dumps(rule_tree.to_json())
+    check('add past the end gives None', rule_tree.add('/rules/children/9', rule('x')) is None)
+    check('add under a missing rule gives None',
+          rule_tree.add('/rules/children/9/children/0', rule('x')) is None)
+    check('add at the end of a missing rule gives None',
+          rule_tree.add('/rules/children/9/children/-', rule('x')) is None)
+    check('add at a bad position gives None',
+          rule_tree.add('/rules/children/one', rule('x')) is None)
+    check('get with a bad path gives None',
+          rule_tree.get('/rules/children') is None and rule_tree.get('/rule/children/0') is None)
+    check('failed adds change nothing',
+          json.dumps(rule_tree.to_json()) == before and indexed_right(rule_tree))
+
+    # What the patch command does with a big CSV file: every row added at the same place, which
+    # must not get slower with every rule already added
+    rule_tree = RuleTree(copy.deepcopy(RULES))
+    expected = copy.deepcopy(RULES)
+    started = time.perf_counter()
+    for row in range(LARGE_ROWS):
+        rule_tree.add('/rules/children/0/children/0', rule('Row ' + str(row)))
+    seconds = time.perf_counter() - started
+    for row in range(LARGE_ROWS):
+        json_add(expected, '/rules/children/0/children/0', rule('Row ' + str(row)))
+    check('add ' + str(LARGE_ROWS) + ' rows at one place',
+          json.dumps(rule_tree.to_json(), sort_keys=SORTED) ==
+          json.dumps(expected, sort_keys=SORTED))
+    check('add ' + str(LARGE_ROWS) + ' rows in under ' + str(LARGE_SECONDS) + 's',
+          seconds < LARGE_SECONDS)
+    check('indexes after adding ' + str(LARGE_ROWS) + ' rows', indexed_right(rule_tree))
+
+    print('Rule tree checks failed:', failed)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()